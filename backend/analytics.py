@@ -0,0 +1,105 @@
+"""Hourly view buckets and a precomputed, time-decayed trending ranking"""
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from pymongo import UpdateOne
+
+logger = logging.getLogger(__name__)
+
+TRENDING_ID = "trending"
+
+
+def bucket_hour(moment: datetime) -> datetime:
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def bucket_updates(counts: Counter, moment: Optional[datetime] = None) -> List[UpdateOne]:
+    """Upserts adding ``counts`` to each project's bucket for the hour of ``moment``"""
+    hour = bucket_hour(moment or datetime.utcnow())
+    return [
+        UpdateOne(
+            {"_id": f"{project_id}:{hour:%Y%m%d%H}"},
+            {"$inc": {"count": count}, "$setOnInsert": {"project_id": project_id, "hour": hour}},
+            upsert=True
+        )
+        for project_id, count in counts.items()
+    ]
+
+
+class TrendingRollup:
+    """Periodically ranks projects by bucketed views with exponential time decay.
+
+    The top ``top_n`` projects, with their summaries, are stored in one
+    document so GET /api/projects/trending is a single lookup by _id. Every
+    worker may run the rollup; it is idempotent.
+    """
+
+    def __init__(self, db, summary_projection: dict, interval_seconds: float = 60,
+                 window_hours: int = 168, half_life_hours: float = 24, top_n: int = 50):
+        self.db = db
+        self.summary_projection = summary_projection
+        self.interval = interval_seconds
+        self.window_hours = window_hours
+        self.half_life_hours = half_life_hours
+        self.top_n = top_n
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def rollup(self) -> List[dict]:
+        now = datetime.utcnow()
+        half_life_ms = self.half_life_hours * 3600 * 1000
+        pipeline = [
+            {"$match": {"hour": {"$gte": now - timedelta(hours=self.window_hours)}}},
+            {"$group": {
+                "_id": "$project_id",
+                "views": {"$sum": "$count"},
+                # count * 0.5 ^ (age / half-life)
+                "score": {"$sum": {"$multiply": [
+                    "$count",
+                    {"$pow": [0.5, {"$divide": [{"$subtract": [now, "$hour"]}, half_life_ms]}]},
+                ]}},
+            }},
+            {"$sort": {"score": -1}},
+            {"$limit": self.top_n},
+        ]
+        ranked = await self.db.project_view_buckets.aggregate(pipeline).to_list(self.top_n)
+
+        summaries = {}
+        if ranked:
+            cursor = self.db.hover_items.find({"id": {"$in": [r["_id"] for r in ranked]}}, self.summary_projection)
+            async for project in cursor:
+                summaries[project["id"]] = project
+
+        items = [
+            {"project": summaries[r["_id"]], "score": round(r["score"], 3), "window_views": r["views"]}
+            for r in ranked if r["_id"] in summaries
+        ]
+        await self.db.app_meta.replace_one(
+            {"_id": TRENDING_ID},
+            {"_id": TRENDING_ID, "generated_at": now, "window_hours": self.window_hours, "items": items},
+            upsert=True
+        )
+        return items
+
+    async def _run(self):
+        while True:
+            try:
+                await self.rollup()
+            except Exception:
+                logger.exception("Trending rollup failed")
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,63 @@
+"""Single-flight coalescing of identical concurrent reads"""
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, Optional
+
+from cache import TTLCache
+
+
+class SingleFlight:
+    """Concurrent calls with the same key share one in-flight awaitable.
+
+    The shared work runs in its own task, so a caller that is cancelled (client
+    disconnect) does not cancel it for the others. With ``cache_ttl`` > 0 the
+    result is also kept briefly after it completes. Callers must not mutate
+    the shared result.
+    """
+
+    def __init__(self, cache_ttl: float = 0, cache_size: int = 1024):
+        self.cache: Optional[TTLCache] = TTLCache(maxsize=cache_size, ttl=cache_ttl) if cache_ttl > 0 else None
+        self.calls = 0
+        self.executed = 0
+        self.merged = 0
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable]):
+        self.calls += 1
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.executed += 1
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        else:
+            self.merged += 1
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if self.cache is not None and result is not None:
+            self.cache.set(key, result)
+
+    def invalidate(self, key: Hashable):
+        if self.cache is not None:
+            self.cache.invalidate(key)
+
+    def stats(self) -> dict:
+        stats = {
+            "calls": self.calls,
+            "executed": self.executed,
+            "merged": self.merged,
+            "in_flight": len(self._inflight),
+        }
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        return stats
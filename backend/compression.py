@@ -0,0 +1,204 @@
+"""gzip/brotli response compression with a cache of compressed bodies keyed by content hash"""
+import hashlib
+import zlib
+from typing import Dict, Optional
+
+from starlette.datastructures import MutableHeaders
+
+from cache import TTLCache
+
+try:
+    import brotli
+except ImportError:  # listed in requirements.txt; without it only gzip is offered
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/javascript")
+# Suffix added inside a compressed response's ETag so each encoding has its own tag
+ETAG_SUFFIXES = {"br": "-br", "gzip": "-gzip"}
+
+
+def _accepted_encodings(header: str) -> Dict[str, float]:
+    accepted = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def _compressor(encoding: str, level: int):
+    if encoding == "br":
+        return brotli.Compressor(quality=min(level, 11))
+    # wbits=31 writes a gzip header and trailer
+    return zlib.compressobj(min(level, 9), zlib.DEFLATED, 31)
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=min(level, 11))
+    compressor = _compressor(encoding, level)
+    return compressor.compress(body) + compressor.flush()
+
+
+class CompressionMiddleware:
+    """Negotiates br/gzip from Accept-Encoding and compresses responses above ``minimum_size``.
+
+    ``route_levels`` maps route templates (e.g. "/api/projects/export") to a compression
+    level; gzip uses 1-9 and brotli quality 0-11, so the same number is clamped per codec.
+    Buffered 200 responses that carry an ETag (the repeatable public reads) are compressed
+    once per distinct body and served from a small cache afterwards. The cache is keyed by
+    a digest of the body, so a view count that changes under the same ETag is never served
+    stale. Streaming responses are compressed chunk by chunk.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, level: int = 6,
+                 route_levels: Optional[Dict[str, int]] = None, cache_size: int = 256,
+                 cache_ttl: float = 300):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        self.route_levels = route_levels or {}
+        self.cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+
+    def negotiate(self, scope) -> Optional[str]:
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accepted = _accepted_encodings(value.decode("latin-1"))
+                wildcard = accepted.get("*", 0)
+                if brotli is not None and accepted.get("br", wildcard) > 0:
+                    return "br"
+                if accepted.get("gzip", wildcard) > 0:
+                    return "gzip"
+                return None
+        return None
+
+    def level_for(self, scope) -> int:
+        route = scope.get("route")
+        return self.route_levels.get(getattr(route, "path", scope["path"]), self.level)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = self.negotiate(scope)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, scope, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, scope, send, encoding: str):
+        self.middleware = middleware
+        self.scope = scope
+        self.downstream = send
+        self.encoding = encoding
+        self.suffix = ETAG_SUFFIXES[encoding]
+        self.start_message = None
+        self.mode = None  # "passthrough" or "stream" once the first body message arrives
+        self.compressor = None
+        self.revalidating_suffix = self._strip_if_none_match()
+
+    def _strip_if_none_match(self) -> bool:
+        """Let the app compare If-None-Match against its own, unsuffixed ETags"""
+        headers = self.scope["headers"]
+        for index, (name, value) in enumerate(headers):
+            if name == b"if-none-match":
+                tag_suffix = (self.suffix + '"').encode("latin-1")
+                if tag_suffix in value:
+                    stripped = value.replace(tag_suffix, b'"')
+                    self.scope["headers"] = headers[:index] + [(name, stripped)] + headers[index + 1:]
+                    return True
+        return False
+
+    def _tag(self, headers: MutableHeaders):
+        etag = headers.get("etag")
+        if etag and etag.endswith('"'):
+            headers["etag"] = etag[:-1] + self.suffix + '"'
+
+    def _compressible(self, headers: MutableHeaders, status: int) -> bool:
+        if status < 200 or status in (204, 304) or "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    async def send(self, message):
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.start_message = message
+            return
+        if message_type != "http.response.body":
+            await self.downstream(message)
+            return
+
+        if self.mode is None:
+            await self._first_body(message)
+        elif self.mode == "stream":
+            await self._stream_body(message)
+        else:
+            await self.downstream(message)
+
+    async def _first_body(self, message):
+        start = self.start_message
+        headers = MutableHeaders(scope=start)
+        status = start["status"]
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self._compressible(headers, status) or (not more_body and len(body) < self.middleware.minimum_size):
+            # A 304 answering a compressed tag must repeat that tag
+            if status == 304 and self.revalidating_suffix:
+                self._tag(headers)
+            self.mode = "passthrough"
+            await self.downstream(start)
+            await self.downstream(message)
+            return
+
+        level = self.middleware.level_for(self.scope)
+        headers["content-encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+
+        if not more_body:
+            cache_key = None
+            if status == 200 and "etag" in headers:
+                # Hashing is cheap next to compressing, and the digest covers every byte
+                cache_key = (hashlib.blake2b(body, digest_size=16).digest(), self.encoding, level)
+            compressed = self.middleware.cache.get(cache_key) if cache_key else None
+            if compressed is None:
+                compressed = compress(body, self.encoding, level)
+                if cache_key:
+                    self.middleware.cache.set(cache_key, compressed)
+            self._tag(headers)
+            headers["content-length"] = str(len(compressed))
+            self.mode = "passthrough"
+            await self.downstream(start)
+            await self.downstream({"type": "http.response.body", "body": compressed})
+            return
+
+        # Streaming body: length is unknown, compress and flush each chunk
+        self._tag(headers)
+        if "content-length" in headers:
+            del headers["content-length"]
+        self.compressor = _compressor(self.encoding, level)
+        self.mode = "stream"
+        await self.downstream(start)
+        await self._stream_body(message)
+
+    async def _stream_body(self, message):
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.encoding == "br":
+            data = self.compressor.process(body)
+            data += self.compressor.flush() if more_body else self.compressor.finish()
+        else:
+            data = self.compressor.compress(body)
+            data += self.compressor.flush(zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH)
+        await self.downstream({"type": "http.response.body", "body": data, "more_body": more_body})
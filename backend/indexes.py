@@ -0,0 +1,141 @@
+"""Declarative MongoDB index bootstrap for the HoverBoard collections"""
+import logging
+from typing import Dict, List
+
+from pymongo import ASCENDING, TEXT, IndexModel
+from pymongo.errors import OperationFailure
+
+from search import SEARCH_WEIGHTS
+
+logger = logging.getLogger(__name__)
+
+# Options that make two indexes with the same key pattern behave differently
+COMPARED_OPTIONS = ("unique", "sparse", "partialFilterExpression", "default_language", "expireAfterSeconds")
+
+# Index declarations per collection. The default _id index is implicit.
+INDEXES: Dict[str, List[IndexModel]] = {
+    "users": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+        # Usernames are empty until select-username runs, so only chosen names must be unique
+        IndexModel(
+            [("username", ASCENDING)],
+            name="username_unique",
+            unique=True,
+            partialFilterExpression={"username": {"$gt": ""}},
+        ),
+    ],
+    "hover_items": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        # A user's projects in keyset pagination order (profile grid and /page lookup)
+        IndexModel(
+            [("user_id", ASCENDING), ("created_at", ASCENDING), ("id", ASCENDING)],
+            name="user_id_created_at_id",
+        ),
+        # Keyset pagination order for the public feed
+        IndexModel([("created_at", ASCENDING), ("id", ASCENDING)], name="created_at_id"),
+        # Filtered feed pages keep the same keyset order
+        IndexModel(
+            [("category", ASCENDING), ("created_at", ASCENDING), ("id", ASCENDING)],
+            name="category_created_at_id",
+        ),
+        IndexModel(
+            [("status", ASCENDING), ("created_at", ASCENDING), ("id", ASCENDING)],
+            name="status_created_at_id",
+        ),
+        IndexModel(
+            [("tech_stack", ASCENDING), ("created_at", ASCENDING), ("id", ASCENDING)],
+            name="tech_stack_created_at_id",
+        ),
+        # Ranked search; language "none" because most content is Indonesian, which has no stemmer
+        IndexModel(
+            [(field, TEXT) for field in SEARCH_WEIGHTS],
+            name="project_text",
+            weights=SEARCH_WEIGHTS,
+            default_language="none",
+        ),
+        # Prefix (type-ahead) search over the words of the searchable fields
+        IndexModel([("search_tokens", ASCENDING)], name="search_tokens"),
+    ],
+    # One document per project per hour, written by the view counter flush
+    "project_view_buckets": [
+        IndexModel([("project_id", ASCENDING), ("hour", ASCENDING)], name="project_id_hour"),
+        # Trending window scans; buckets older than 90 days expire
+        IndexModel([("hour", ASCENDING)], name="hour_ttl", expireAfterSeconds=90 * 24 * 3600),
+    ],
+}
+
+
+def _spec(info: dict) -> dict:
+    """Normalize an index description to its key pattern and behavioural options"""
+    key = info["key"]
+    if hasattr(key, "items"):
+        key = key.items()
+    key = [(field, direction) for field, direction in key]
+    spec = {"key": key}
+
+    # The server stores text indexes as _fts/_ftsx plus a weight per field,
+    # so compare those weights instead of the declared key pattern
+    text_fields = [field for field, direction in key if direction == TEXT and field != "_fts"]
+    if text_fields or ("_fts", TEXT) in key:
+        spec["key"] = [(f, d) for f, d in key if d != TEXT and f not in ("_fts", "_ftsx")]
+        spec["weights"] = {**{field: 1 for field in text_fields}, **info.get("weights", {})}
+
+    for option in COMPARED_OPTIONS:
+        if option in info:
+            spec[option] = info[option]
+    return spec
+
+
+async def index_drift(db) -> Dict[str, dict]:
+    """Compare the declared indexes with what exists in the database"""
+    report = {}
+    for collection_name, models in INDEXES.items():
+        existing = await db[collection_name].index_information()
+        existing.pop("_id_", None)
+
+        missing, changed = [], []
+        for model in models:
+            declared = model.document
+            name = declared["name"]
+            if name not in existing:
+                missing.append(name)
+            elif _spec(existing[name]) != _spec(declared):
+                changed.append(name)
+
+        declared_names = {model.document["name"] for model in models}
+        extra = sorted(name for name in existing if name not in declared_names)
+        report[collection_name] = {"missing": missing, "changed": changed, "extra": extra}
+    return report
+
+
+async def ensure_indexes(db) -> Dict[str, dict]:
+    """Create any missing indexes and log drift between the declaration and the database"""
+    drift = await index_drift(db)
+    for collection_name, models in INDEXES.items():
+        collection_drift = drift[collection_name]
+        if collection_drift["changed"]:
+            # create_indexes would fail with IndexOptionsConflict; leave it to an operator
+            logger.warning(
+                "Index drift on %s: %s differ from the declaration",
+                collection_name, ", ".join(collection_drift["changed"])
+            )
+        if collection_drift["extra"]:
+            logger.info(
+                "Undeclared indexes on %s: %s",
+                collection_name, ", ".join(collection_drift["extra"])
+            )
+
+        to_create = [m for m in models if m.document["name"] in collection_drift["missing"]]
+        if not to_create:
+            continue
+        try:
+            await db[collection_name].create_indexes(to_create)
+            logger.info(
+                "Created indexes on %s: %s",
+                collection_name, ", ".join(m.document["name"] for m in to_create)
+            )
+        except OperationFailure as exc:
+            # Usually duplicate data blocking a unique index; keep serving without it
+            logger.error("Could not create indexes on %s: %s", collection_name, exc)
+    return drift
@@ -0,0 +1,331 @@
+"""Request and MongoDB command metrics in the Prometheus text format"""
+import threading
+from bisect import bisect_left
+from collections import deque
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from pymongo import monitoring
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; shared by every histogram so bucket lists are allocated once per label set
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+INF_BUCKET = 'le="+Inf"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._values: Dict[tuple, float] = {}
+
+    def inc(self, labels: tuple = (), amount: float = 1):
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.label_names, labels)} {_number(value)}")
+        return lines
+
+
+class Gauge:
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {_number(self.value)}",
+        ]
+
+
+class Histogram:
+    """Histogram with fixed buckets; each label set owns one preallocated list of counts"""
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...],
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = buckets
+        # labels -> [count per bucket..., count above the last bucket, sum]
+        self._series: Dict[tuple, list] = {}
+
+    def observe(self, labels: tuple, value: float):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                le = _labels(self.label_names, labels, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            cumulative += series[len(self.buckets)]
+            lines.append(f"{self.name}_bucket{_labels(self.label_names, labels, INF_BUCKET)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, labels)} {_number(series[-1])}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+
+class HttpMetrics:
+    """Per-route latency, status counts and in-flight requests"""
+
+    def __init__(self):
+        self.latency = Histogram(
+            "http_request_duration_seconds", "HTTP request latency by route template.",
+            ("method", "route")
+        )
+        self.responses = Counter(
+            "http_responses_total", "HTTP responses by route template and status code.",
+            ("method", "route", "status")
+        )
+        self.in_flight = Gauge("http_requests_in_flight", "HTTP requests currently being served.")
+        self.startup = Gauge("app_startup_duration_seconds", "Time the last startup took before accepting traffic.")
+
+    def render(self) -> List[str]:
+        return self.latency.render() + self.responses.render() + self.in_flight.render() + self.startup.render()
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware, so it adds no BaseHTTPMiddleware task or body copying"""
+
+    def __init__(self, app, metrics: HttpMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = [500]
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        metrics = self.metrics
+        metrics.in_flight.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - start
+            metrics.in_flight.dec()
+            # The router stores the matched route in the scope; label by template, not raw path
+            route = scope.get("route")
+            labels = (scope["method"], getattr(route, "path", "unmatched"))
+            metrics.latency.observe(labels, elapsed)
+            metrics.responses.inc(labels + (str(status[0]),))
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Time per collection and command, fed by pymongo command monitoring.
+
+    Motor runs pymongo on worker threads, so updates are guarded by a lock.
+    """
+
+    def __init__(self):
+        self.latency = Histogram(
+            "mongodb_command_duration_seconds", "MongoDB command latency by collection and command.",
+            ("collection", "command")
+        )
+        self.failures = Counter(
+            "mongodb_command_failures_total", "Failed MongoDB commands by collection and command.",
+            ("collection", "command")
+        )
+        self._collections: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _collection(event: monitoring.CommandStartedEvent) -> str:
+        command = event.command
+        if event.command_name == "getMore":
+            return str(command.get("collection", ""))
+        target = command.get(event.command_name)
+        return target if isinstance(target, str) else ""
+
+    def started(self, event):
+        with self._lock:
+            self._collections[event.request_id] = self._collection(event)
+
+    def succeeded(self, event):
+        with self._lock:
+            collection = self._collections.pop(event.request_id, "")
+            self.latency.observe((collection, event.command_name), event.duration_micros / 1e6)
+
+    def failed(self, event):
+        with self._lock:
+            collection = self._collections.pop(event.request_id, "")
+            self.latency.observe((collection, event.command_name), event.duration_micros / 1e6)
+            self.failures.inc((collection, event.command_name))
+
+    def render(self) -> List[str]:
+        with self._lock:
+            return self.latency.render() + self.failures.render()
+
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """Connection pool size, checkouts in use, waiters and checkout wait time per server.
+
+    A checkout starts and completes on the same Motor worker thread, so the
+    start time is kept in a thread-local.
+    """
+
+    def __init__(self, recent_waits: int = 1000):
+        self.wait = Histogram(
+            "mongodb_pool_checkout_wait_seconds", "Time spent waiting to check out a pooled connection.",
+            ("address",)
+        )
+        self.checkout_failures = Counter(
+            "mongodb_pool_checkout_failures_total", "Failed connection checkouts by reason.",
+            ("address", "reason")
+        )
+        self.open: Dict[str, int] = {}
+        self.in_use: Dict[str, int] = {}
+        self.waiting: Dict[str, int] = {}
+        self._recent: Dict[str, deque] = {}
+        self._recent_size = recent_waits
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _address(event) -> str:
+        host, port = event.address
+        return f"{host}:{port}"
+
+    def _add(self, gauge: Dict[str, int], address: str, amount: int):
+        with self._lock:
+            gauge[address] = gauge.get(address, 0) + amount
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        with self._lock:
+            address = self._address(event)
+            for gauge in (self.open, self.in_use, self.waiting):
+                gauge.pop(address, None)
+
+    def connection_created(self, event):
+        self._add(self.open, self._address(event), 1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._add(self.open, self._address(event), -1)
+
+    def connection_check_out_started(self, event):
+        self._local.started = perf_counter()
+        self._add(self.waiting, self._address(event), 1)
+
+    def connection_check_out_failed(self, event):
+        address = self._address(event)
+        with self._lock:
+            self.waiting[address] = self.waiting.get(address, 0) - 1
+            self.checkout_failures.inc((address, str(event.reason)))
+
+    def connection_checked_out(self, event):
+        address = self._address(event)
+        waited = perf_counter() - getattr(self._local, "started", perf_counter())
+        with self._lock:
+            self.waiting[address] = self.waiting.get(address, 0) - 1
+            self.in_use[address] = self.in_use.get(address, 0) + 1
+            self.wait.observe((address,), waited)
+            recent = self._recent.setdefault(address, deque(maxlen=self._recent_size))
+            recent.append(waited)
+
+    def connection_checked_in(self, event):
+        self._add(self.in_use, self._address(event), -1)
+
+    def snapshot(self, max_pool_size: int) -> Dict[str, dict]:
+        """Per-server utilization and recent checkout waits in milliseconds"""
+        with self._lock:
+            servers = {}
+            for address in sorted(set(self.open) | set(self.in_use)):
+                waits = sorted(self._recent.get(address, ()))
+                in_use = self.in_use.get(address, 0)
+                servers[address] = {
+                    "open": self.open.get(address, 0),
+                    "in_use": in_use,
+                    "waiting": self.waiting.get(address, 0),
+                    "max_pool_size": max_pool_size,
+                    "utilization": round(in_use / max_pool_size, 3) if max_pool_size else 0.0,
+                    "checkout_wait_ms": {
+                        "samples": len(waits),
+                        "p50": round(_nearest_rank(waits, 50) * 1000, 3),
+                        "p95": round(_nearest_rank(waits, 95) * 1000, 3),
+                        "max": round((waits[-1] if waits else 0.0) * 1000, 3),
+                    },
+                }
+            return servers
+
+    def render(self) -> List[str]:
+        with self._lock:
+            lines = []
+            for name, documentation, gauge in (
+                ("mongodb_pool_connections", "Open pooled connections per server.", self.open),
+                ("mongodb_pool_connections_in_use", "Checked-out connections per server.", self.in_use),
+                ("mongodb_pool_checkout_waiters", "Operations waiting for a connection per server.", self.waiting),
+            ):
+                lines += [f"# HELP {name} {documentation}", f"# TYPE {name} gauge"]
+                lines += [f"{name}{_labels(('address',), (address,))} {value}" for address, value in sorted(gauge.items())]
+            return lines + self.wait.render() + self.checkout_failures.render()
+
+
+def _nearest_rank(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def render(*collectors) -> str:
+    lines = []
+    for collector in collectors:
+        lines.extend(collector.render())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,75 @@
+"""Token-bucket rate limiting with a pluggable state backend"""
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Tuple
+
+
+class RateLimitBackend(ABC):
+    """Stores token buckets. Implement ``take`` over shared storage (e.g. Redis) to share limits across workers."""
+
+    @abstractmethod
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        """Spend one token from ``key``'s bucket; return 0 when allowed, else seconds until a token is available"""
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Per-process buckets in an OrderedDict ordered by last use, so every operation is O(1).
+
+    Every ``sweep_every`` calls the least recently used buckets that have
+    refilled completely (and so carry no state) are evicted; beyond
+    ``max_keys`` the oldest bucket is dropped regardless.
+    """
+
+    def __init__(self, max_keys: int = 100000, sweep_every: int = 1000, clock=time.monotonic):
+        self.max_keys = max_keys
+        self.sweep_every = sweep_every
+        self._clock = clock
+        # key -> (tokens, updated_at, seconds to refill from empty)
+        self._buckets: "OrderedDict[str, Tuple[float, float, float]]" = OrderedDict()
+        self._calls = 0
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        now = self._clock()
+        tokens, updated, _ = self._buckets.pop(key, (float(burst), now, 0.0))
+        tokens = min(float(burst), tokens + (now - updated) * rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+        self._buckets[key] = (tokens, now, burst / rate)
+
+        self._calls += 1
+        if self._calls % self.sweep_every == 0:
+            self._sweep(now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+    def _sweep(self, now: float):
+        while self._buckets:
+            key, (_, updated, refill_seconds) = next(iter(self._buckets.items()))
+            if now - updated < refill_seconds:
+                break
+            del self._buckets[key]
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class RateLimit:
+    """``per_minute`` sustained requests with bursts of up to ``burst``"""
+
+    def __init__(self, per_minute: float, burst: int):
+        self.rate = per_minute / 60
+        self.burst = burst
+
+
+class RateLimiter:
+    def __init__(self, backend: RateLimitBackend):
+        self.backend = backend
+
+    async def check(self, key: str, limit: RateLimit) -> float:
+        """Return 0 when the request may proceed, else the Retry-After delay in seconds"""
+        return await self.backend.take(key, limit.rate, limit.burst)
@@ -0,0 +1,34 @@
+"""Fast response helpers for trusted database reads"""
+from typing import Any, Callable, Type
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def document_reader(model: Type[BaseModel]) -> Callable[[dict], dict]:
+    """Return a function that shapes a stored document like ``model`` without validating it.
+
+    Documents in our collections were written from validated models, so only
+    missing fields (older documents) need their defaults; extra keys such as
+    ``_id`` are dropped.
+    """
+    fields = list(model.model_fields.items())
+
+    def read(document: dict) -> dict:
+        return {
+            name: document[name] if name in document else field.get_default(call_default_factory=True)
+            for name, field in fields
+        }
+
+    return read
+
+
+def trusted_json(content: Any, response: Response = None, status_code: int = 200) -> ORJSONResponse:
+    """Serialize content straight to JSON bytes, skipping FastAPI's jsonable_encoder pass.
+
+    Headers already set on the injected ``response`` (ETag, cursors) are carried over,
+    since FastAPI ignores them when a handler returns its own Response.
+    """
+    headers = dict(response.headers) if response is not None else None
+    return ORJSONResponse(content, status_code=status_code, headers=headers)
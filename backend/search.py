@@ -0,0 +1,69 @@
+"""Full-text and prefix search support for projects"""
+import logging
+import re
+from typing import Dict, List, Optional
+
+from pymongo import UpdateOne
+
+logger = logging.getLogger(__name__)
+
+# Searchable fields and their text-index weights
+SEARCH_WEIGHTS: Dict[str, int] = {
+    "title": 10,
+    "subtitle": 5,
+    "tech_stack": 5,
+    "features": 3,
+    "description": 2,
+    "detailed_description": 1,
+}
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def search_tokens(project: dict) -> List[str]:
+    """Distinct lowercase words of a project's searchable fields, stored for prefix lookups"""
+    tokens = set()
+    for field in SEARCH_WEIGHTS:
+        value = project.get(field) or ""
+        for text in (value if isinstance(value, list) else [value]):
+            tokens.update(tokenize(text))
+    return sorted(tokens)
+
+
+def prefix_query(q: str) -> Optional[dict]:
+    """Match every complete word of ``q`` and treat the last word as a prefix (type-ahead)"""
+    words = tokenize(q)
+    if not words:
+        return None
+    *complete, partial = words
+    # Anchored, case-sensitive regexes on a lowercase field stay index range scans
+    clauses = [{"search_tokens": {"$regex": "^" + re.escape(partial)}}]
+    if complete:
+        clauses.insert(0, {"search_tokens": {"$all": complete}})
+    return {"$and": clauses}
+
+
+async def backfill_search_tokens(collection, batch_size: int = 500) -> int:
+    """Add search_tokens to projects written before search existed"""
+    updated = 0
+    cursor = collection.find(
+        {"search_tokens": {"$exists": False}},
+        {"_id": 0, "id": 1, **{field: 1 for field in SEARCH_WEIGHTS}}
+    ).batch_size(batch_size)
+    batch = []
+    async for project in cursor:
+        batch.append(UpdateOne({"id": project["id"]}, {"$set": {"search_tokens": search_tokens(project)}}))
+        if len(batch) >= batch_size:
+            await collection.bulk_write(batch, ordered=False)
+            updated += len(batch)
+            batch = []
+    if batch:
+        await collection.bulk_write(batch, ordered=False)
+        updated += len(batch)
+    if updated:
+        logger.info("Backfilled search tokens for %d projects", updated)
+    return updated
@@ -1,35 +1,113 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Request, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from dotenv import load_dotenv
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
-import os
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import DeleteOne, InsertOne, ReadPreference, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 import logging
-from pathlib import Path
-from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional
+from pydantic import BaseModel, Field, EmailStr, ValidationError
+from typing import Dict, List, Literal, Optional, Tuple
+from contextlib import asynccontextmanager
 import uuid
 from datetime import datetime, timedelta
-import bcrypt
+import asyncio
+import base64
+import csv
+import hashlib
+import io
+import json
+import math
+import time
 import jwt
+import orjson
 import re
 
+from analytics import TRENDING_ID, TrendingRollup, bucket_hour
+from cache import TTLCache
+from coalesce import SingleFlight
+from compression import CompressionMiddleware
+from indexes import ensure_indexes
+import metrics
+from passwords import PasswordHasher, PasswordHasherBusy
+from ratelimit import MemoryRateLimitBackend, RateLimit, RateLimiter
+from responses import ORJSONResponse, document_reader, trusted_json
+from search import SEARCH_WEIGHTS, backfill_search_tokens, prefix_query, search_tokens
+from settings import Settings
+from shedding import ConcurrencyLimiter, LoadSheddingMiddleware
+from versions import VersionStore, etag_matches, make_etag
+from views import VIEWS_SCOPE, ViewCounter
 
-ROOT_DIR = Path(__file__).parent
-load_dotenv(ROOT_DIR / '.env')
+
+logger = logging.getLogger(__name__)
+
+# Read and validated once per process; create_app() may be given another instance
+settings = Settings.from_env()
 
 # JWT Configuration
-JWT_SECRET = os.environ.get('JWT_SECRET', 'your-secret-key-here')
 JWT_ALGORITHM = 'HS256'
 JWT_EXPIRATION_HOURS = 24
 
-# MongoDB connection
-mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+# Request limits, fixed at import because they shape route signatures and models
+DEFAULT_PAGE_SIZE = settings.default_page_size
+MAX_PAGE_SIZE = settings.max_page_size
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+SEARCH_DEFAULT_LIMIT = settings.search_default_limit
+FACET_FIELDS = ("category", "tech_stack", "status")
+BULK_MAX_OPERATIONS = settings.bulk_max_operations
+EXPORT_BATCH_SIZE = settings.export_batch_size
+TRENDING_TOP_N = settings.trending_top_n
+TRENDING_WINDOW_HOURS = settings.trending_window_hours
+# Matches the TTL on project_view_buckets
+VIEW_BUCKET_RETENTION_HOURS = 90 * 24
+
+SEED_LOCK_ID = "sample_data"
+
+# Load shedding groups as (group, method or None, path prefix); first match wins,
+# everything else is "default". Unlimited paths stay responsive during overload.
+SHED_ROUTE_GROUPS = (
+    ("auth", "POST", "/api/auth/"),
+    ("export", "GET", "/api/projects/export"),
+    ("reads", "GET", "/api/projects"),
+    ("reads", "GET", "/api/users/"),
+    ("reads", "GET", "/api/hover-items"),
+)
+SHED_UNLIMITED_PATHS = ("/api/", "/api/auth/me", "/api/health/db", "/metrics")
+
+READ_PREFERENCES = {
+    "primary": ReadPreference.PRIMARY,
+    "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
+    "secondary": ReadPreference.SECONDARY,
+    "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST,
+}
+
+# Process-wide metrics, kept across app instances
+mongo_metrics = metrics.MongoCommandMetrics()
+mongo_pool_metrics = metrics.MongoPoolMetrics()
+http_metrics = metrics.HttpMetrics()
 
-# Create the main app without a prefix
-app = FastAPI()
+# Resources owned by the app lifespan (see open_resources). They are module
+# globals so route handlers can reach them, which means one app per process.
+client: Optional[AsyncIOMotorClient] = None
+db = None
+# The same database once per configured read preference name, for anonymous public reads
+public_dbs: Dict[str, AsyncIOMotorDatabase] = {}
+view_counter: Optional[ViewCounter] = None
+version_store: Optional[VersionStore] = None
+# Shared in-flight reads for hot project and profile lookups
+read_coalescer: Optional[SingleFlight] = None
+# Facet counts keyed by ETag, so a version bump retires old entries
+facet_cache: Optional[TTLCache] = None
+trending_rollup: Optional[TrendingRollup] = None
+password_hasher: Optional[PasswordHasher] = None
+# Caches for get_current_user
+user_cache: Optional[TTLCache] = None
+token_cache: Optional[TTLCache] = None
+# Auth endpoint throttling; None when RATE_LIMIT_ENABLED is false
+rate_limiter: Optional[RateLimiter] = None
+ip_rate_limit: Optional[RateLimit] = None
+email_rate_limit: Optional[RateLimit] = None
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -37,6 +115,7 @@ api_router = APIRouter(prefix="/api")
 # Security
 security = HTTPBearer()
 
+
 # User Models
 class User(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -76,6 +155,12 @@ class UserProfile(BaseModel):
     created_at: datetime
     is_active: bool
 
+class ProjectAuthor(BaseModel):
+    """Compact author block embedded in feed items"""
+    username: str
+    full_name: str
+    avatar_url: str
+
 class UserUpdate(BaseModel):
     full_name: Optional[str] = None
     bio: Optional[str] = None
@@ -107,6 +192,27 @@ class HoverItem(BaseModel):
     status: str = "completed"
     views: int = 0
 
+class HoverItemSummary(BaseModel):
+    """Fields needed by the grid and profile cards; use ?view=full for the rest"""
+    id: str
+    user_id: str
+    title: str
+    subtitle: str
+    description: str
+    category: str
+    image_url: str
+    hover_content: str
+    fun_fact: str
+    tech_stack: List[str] = []
+    link_url: Optional[str] = None
+    created_at: datetime
+    status: str = "completed"
+    views: int = 0
+
+SUMMARY_PROJECTION = {"_id": 0, **{field: 1 for field in HoverItemSummary.model_fields}}
+# Full reads skip the prefix-search tokens, which only the search index uses
+FULL_PROJECTION = {"_id": 0, "search_tokens": 0}
+
 class HoverItemCreate(BaseModel):
     title: str
     subtitle: str
@@ -128,40 +234,324 @@ class HoverItemCreate(BaseModel):
     team_size: int = 1
     status: str = "completed"
 
+class HoverItemUpdate(BaseModel):
+    title: Optional[str] = None
+    subtitle: Optional[str] = None
+    description: Optional[str] = None
+    detailed_description: Optional[str] = None
+    category: Optional[str] = None
+    image_url: Optional[str] = None
+    gallery_images: Optional[List[str]] = None
+    hover_content: Optional[str] = None
+    fun_fact: Optional[str] = None
+    tech_stack: Optional[List[str]] = None
+    features: Optional[List[str]] = None
+    challenges: Optional[List[str]] = None
+    solutions: Optional[List[str]] = None
+    link_url: Optional[str] = None
+    github_url: Optional[str] = None
+    demo_url: Optional[str] = None
+    duration: Optional[str] = None
+    team_size: Optional[int] = None
+    status: Optional[str] = None
+
+# Optional on HoverItem, so PATCH may clear them with null
+CLEARABLE_PROJECT_FIELDS = frozenset({"link_url", "github_url", "demo_url"})
+
+class ProjectBulkOperation(BaseModel):
+    op: Literal["create", "update", "delete"]
+    id: Optional[str] = None
+    # Validated per operation so one bad item does not reject the whole batch
+    data: Optional[dict] = None
+
+class ProjectBulkRequest(BaseModel):
+    operations: List[ProjectBulkOperation] = Field(..., min_length=1, max_length=BULK_MAX_OPERATIONS)
+
 # Authentication Helper Functions
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+def password_hasher_busy():
+    return HTTPException(
+        status_code=503,
+        detail="Server busy, please try again",
+        headers={"Retry-After": "1"}
+    )
+
+async def hash_password(password: str) -> str:
+    try:
+        return await password_hasher.hash(password)
+    except PasswordHasherBusy:
+        raise password_hasher_busy()
 
-def verify_password(password: str, password_hash: str) -> bool:
-    return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+async def verify_password(password: str, password_hash: str) -> bool:
+    try:
+        return await password_hasher.verify(password, password_hash)
+    except PasswordHasherBusy:
+        raise password_hasher_busy()
 
 def create_access_token(data: dict):
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(hours=JWT_EXPIRATION_HOURS)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, settings.jwt_secret, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
+def decode_access_token(token: str) -> dict:
+    """Verify a JWT, reusing the payload of recently verified tokens when the token cache is enabled"""
+    token_key = hashlib.sha256(token.encode('utf-8')).digest()
+    payload = token_cache.get(token_key)
+    if payload is not None and payload["exp"] > time.time():
+        return payload
+    
+    payload = jwt.decode(token, settings.jwt_secret, algorithms=[JWT_ALGORITHM])
+    # Never keep a payload past its own expiry
+    token_cache.set(token_key, payload, ttl=payload["exp"] - time.time())
+    return payload
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     try:
-        payload = jwt.decode(credentials.credentials, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = decode_access_token(credentials.credentials)
         user_id: str = payload.get("sub")
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid token")
     except jwt.PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
     
+    cached_user = user_cache.get(user_id)
+    if cached_user is not None:
+        return cached_user
+    
     user = await db.users.find_one({"id": user_id})
     if user is None:
         raise HTTPException(status_code=401, detail="User not found")
     
-    return User(**user)
+    current_user = User(**user)
+    user_cache.set(user_id, current_user)
+    return current_user
+
+# Rate limiting helpers
+def client_ip(request: Request) -> str:
+    """Client address as seen by the outermost trusted proxy.
+
+    Proxies append to X-Forwarded-For, so entries left of the trusted hops are
+    client-supplied and never used.
+    """
+    hops = settings.rate_limit_trusted_proxies
+    if hops:
+        forwarded = [entry.strip() for entry in request.headers.get("x-forwarded-for", "").split(",")]
+        if len(forwarded) >= hops and forwarded[-hops]:
+            return forwarded[-hops]
+    return request.client.host if request.client else "unknown"
+
+async def enforce_rate_limit(key: str, limit: RateLimit):
+    wait = await rate_limiter.check(key, limit)
+    if wait:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many requests, please try again later",
+            headers={"Retry-After": str(math.ceil(wait))}
+        )
+
+def rate_limit_ip(action: str):
+    """Dependency that throttles ``action`` per client IP; declare it before get_current_user"""
+    async def check_ip(request: Request):
+        if rate_limiter is not None:
+            await enforce_rate_limit(f"{action}:ip:{client_ip(request)}", ip_rate_limit)
+    return check_ip
+
+def rate_limit_token_subject(action: str):
+    """Dependency that throttles ``action`` per account from the bearer token, before any user lookup"""
+    async def check_subject(credentials: HTTPAuthorizationCredentials = Depends(security)):
+        if rate_limiter is None:
+            return
+        try:
+            subject = decode_access_token(credentials.credentials).get("sub")
+        except jwt.PyJWTError:
+            # get_current_user rejects the token
+            return
+        if subject:
+            await enforce_rate_limit(f"{action}:user:{subject}", email_rate_limit)
+    return check_subject
+
+async def rate_limit_email(action: str, email: str):
+    if rate_limiter is not None:
+        await enforce_rate_limit(f"{action}:email:{email.lower()}", email_rate_limit)
 
 def validate_username(username: str) -> bool:
     # Username must be 3-30 characters, alphanumeric + underscore, no spaces
     pattern = r'^[a-zA-Z0-9_]{3,30}$'
     return bool(re.match(pattern, username))
 
+# Trusted-read shapers: stored documents were validated on write, so reads skip pydantic
+read_user_profile = document_reader(UserProfile)
+read_hover_item = document_reader(HoverItem)
+read_hover_item_summary = document_reader(HoverItemSummary)
+read_project_author = document_reader(ProjectAuthor)
+AUTHOR_PROJECTION = {"_id": 0, "id": 1, **{field: 1 for field in ProjectAuthor.model_fields}}
+
+# Pagination Helper Functions
+def encode_cursor(created_at: datetime, item_id: str) -> str:
+    raw = json.dumps([created_at.isoformat(), item_id]).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(item_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+async def paginate_projects(
+    database,
+    query: dict,
+    cursor: Optional[str],
+    limit: int,
+    projection: Optional[dict] = None,
+    session=None
+):
+    """Return one keyset page of projects ordered by (created_at, id) and the next cursor"""
+    if cursor:
+        created_at, item_id = decode_cursor(cursor)
+        query = {
+            "$and": [
+                query,
+                {"$or": [
+                    {"created_at": {"$gt": created_at}},
+                    {"created_at": created_at, "id": {"$gt": item_id}},
+                ]},
+            ]
+        }
+
+    # Fetch one extra document to know whether another page exists
+    projects = await database.hover_items.find(query, projection, session=session).sort(
+        [("created_at", 1), ("id", 1)]
+    ).limit(limit + 1).to_list(limit + 1)
+
+    next_cursor = None
+    if len(projects) > limit:
+        projects = projects[:limit]
+        last = projects[-1]
+        next_cursor = encode_cursor(last["created_at"], last["id"])
+
+    return projects, next_cursor
+
+def project_document(project: HoverItem) -> dict:
+    """Stored form of a project, including its prefix-search tokens"""
+    document = project.dict()
+    document["search_tokens"] = search_tokens(document)
+    return document
+
+def project_list_view(view: str):
+    """Mongo projection and document reader for a list view"""
+    if view == "full":
+        return FULL_PROJECTION, read_hover_item
+    return SUMMARY_PROJECTION, read_hover_item_summary
+
+def project_filters(
+    category: Optional[str] = None,
+    tech_stack: Optional[List[str]] = None,
+    project_status: Optional[str] = None
+) -> dict:
+    """Mongo filter for the combinable project list filters; tech_stack must match every value"""
+    query = {}
+    if category:
+        query["category"] = category
+    if tech_stack:
+        query["tech_stack"] = {"$all": tech_stack}
+    if project_status:
+        query["status"] = project_status
+    return query
+
+async def attach_authors(database, items: List[dict], session=None) -> List[dict]:
+    """Embed each item's author with one $in query for the whole page"""
+    user_ids = list({item["user_id"] for item in items})
+    authors = {}
+    if user_ids:
+        async for user in database.users.find({"id": {"$in": user_ids}}, AUTHOR_PROJECTION, session=session):
+            authors[user["id"]] = read_project_author(user)
+    for item in items:
+        item["author"] = authors.get(item["user_id"])
+    return items
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]):
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+# Conditional response helpers
+PROJECTS_SCOPE = "projects"
+
+def user_scope(username: str) -> str:
+    return f"user:{username}"
+
+def public_etag(request: Request, scopes: Tuple[str, ...], versions: Tuple[int, ...]) -> str:
+    # Buffered view counts move between flushes without a version bump, so bodies
+    # carrying them are only weakly described by their tag
+    return make_etag(versions, request.url.path, request.url.query, weak=VIEWS_SCOPE in scopes)
+
+async def conditional_etag(request: Request, response: Response, *scopes: str) -> Optional[Response]:
+    """Set the ETag for a public read and return a 304 response when the client copy is current"""
+    # Read versions before the data so a concurrent write can only make the tag older
+    versions = await version_store.get(*scopes)
+    etag = public_etag(request, scopes, versions)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+def public_read_preference(request: Request) -> str:
+    """Read preference name for this request's route, falling back to the public default"""
+    route = getattr(request.scope.get("route"), "path", None)
+    return settings.mongo_route_read_preferences.get(route, settings.mongo_public_read_preference)
+
+async def public_read(request: Request, response: Response, scopes: Tuple[str, ...], read):
+    """Run ``read(database, session)`` for a public GET whose body the response ETag must describe.
+
+    ``database`` carries the route's read preference. Identical concurrent
+    requests share one read, keyed by the ETag from conditional_etag. Off the
+    primary, the versions are re-read through ``database`` in the same causally
+    consistent session before the data, and the ETag is rebuilt from them, so a
+    tag never claims newer data than its body holds.
+    """
+    preference = public_read_preference(request)
+    database = public_dbs[preference]
+    key = ("public", response.headers["ETag"])
+    if preference == "primary":
+        return await read_coalescer.do(key, lambda: read(database, None))
+    
+    async def consistent_read():
+        async with await client.start_session(causal_consistency=True) as session:
+            versions = await VersionStore(database.app_meta).get(*scopes, session=session)
+            return versions, await read(database, session)
+    
+    versions, result = await read_coalescer.do(key, consistent_read)
+    response.headers["ETag"] = public_etag(request, scopes, versions)
+    return result
+
+async def raise_project_write_error(project_id: str, action: str):
+    """Explain why an owner-filtered write matched nothing (only read on the failure path)"""
+    project = await db.hover_items.find_one({"id": project_id}, {"_id": 0, "user_id": 1})
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    raise HTTPException(status_code=403, detail=f"Not authorized to {action} this project")
+
+async def project_scopes(user_id: str) -> List[str]:
+    """Version scopes that change when ``user_id``'s projects do; run it alongside the write.
+
+    The cached User may predate a username change made on another worker,
+    so the name that keys the profile scope is read from the primary.
+    """
+    scopes = [PROJECTS_SCOPE]
+    owner = await db.users.find_one({"id": user_id}, {"_id": 0, "username": 1})
+    if owner and owner.get("username"):
+        scopes.append(user_scope(owner["username"]))
+    return scopes
+
+async def bump_project_versions(scopes: List[str], *project_ids: str):
+    """Bump ``scopes`` (from project_scopes) once the project write has completed"""
+    for project_id in project_ids:
+        read_coalescer.invalidate(("project", project_id))
+    await version_store.bump(*scopes)
+
 # Sample data initialization
 async def init_sample_data():
     """Initialize sample user and portfolio data"""
@@ -172,7 +562,7 @@ async def init_sample_data():
         sample_user_data = User(
             email="demo@hoverboard.com",
             username="demo_user",
-            password_hash=hash_password("demo123"),
+            password_hash=await hash_password("demo123"),
             full_name="Demo User",
             bio="This is a demo user account for HoverBoard showcase",
             saldo=2500000,
@@ -234,12 +624,55 @@ async def init_sample_data():
         
         for item_data in sample_items:
             item = HoverItem(user_id=sample_user["id"], **item_data.dict())
-            await db.hover_items.insert_one(item.dict())
+            await db.hover_items.insert_one(project_document(item))
+        
+        await bump_project_versions(await project_scopes(sample_user["id"]))
+
+async def seed_sample_data_once():
+    """Run init_sample_data once per deployment, guarded by a lock document shared by all workers.
+
+    A lock left at "seeding" for longer than SEED_LOCK_TIMEOUT_SECONDS (a worker
+    died mid-seed) is taken over by the next startup.
+    """
+    now = datetime.utcnow()
+    stale_before = now - timedelta(seconds=settings.seed_lock_timeout_seconds)
+    try:
+        # Matches only a stale lock; otherwise the upsert inserts a new one, or
+        # collides with a live or finished lock on _id
+        result = await db.app_meta.update_one(
+            {"_id": SEED_LOCK_ID, "status": "seeding", "started_at": {"$lt": stale_before}},
+            {"$set": {"started_at": now}},
+            upsert=True
+        )
+    except DuplicateKeyError:
+        # Another worker holds the lock or seeding is done
+        return False
+
+    if result.upserted_id is None:
+        logger.warning(
+            "Taking over a sample data seed lock held for over %.0f s", settings.seed_lock_timeout_seconds
+        )
+
+    try:
+        await init_sample_data()
+    except Exception:
+        # Release the lock so the next startup can retry
+        await db.app_meta.delete_one({"_id": SEED_LOCK_ID})
+        raise
+
+    await db.app_meta.update_one(
+        {"_id": SEED_LOCK_ID},
+        {"$set": {"status": "done", "finished_at": datetime.utcnow()}}
+    )
+    return True
 
 # Authentication Routes
 @api_router.post("/auth/register")
-async def register(user_data: UserCreate):
+async def register(user_data: UserCreate, _: None = Depends(rate_limit_ip("register"))):
     """Register a new user"""
+    # Throttled before any database or bcrypt work
+    await rate_limit_email("register", user_data.email)
+    
     # Check if email already exists
     existing_user = await db.users.find_one({"email": user_data.email})
     if existing_user:
@@ -249,11 +682,15 @@ async def register(user_data: UserCreate):
     user = User(
         email=user_data.email,
         username="",  # Will be set in username selection
-        password_hash=hash_password(user_data.password),
+        password_hash=await hash_password(user_data.password),
         full_name=user_data.full_name
     )
     
-    await db.users.insert_one(user.dict())
+    try:
+        await db.users.insert_one(user.dict())
+    except DuplicateKeyError:
+        # A concurrent registration with the same email won the unique index
+        raise HTTPException(status_code=400, detail="Email already registered")
     
     # Create access token
     access_token = create_access_token(data={"sub": user.id})
@@ -266,15 +703,27 @@ async def register(user_data: UserCreate):
     }
 
 @api_router.post("/auth/login")
-async def login(user_data: UserLogin):
+async def login(user_data: UserLogin, _: None = Depends(rate_limit_ip("login"))):
     """Login user"""
+    # Throttled before any database or bcrypt work
+    await rate_limit_email("login", user_data.email)
+    
     user = await db.users.find_one({"email": user_data.email})
-    if not user or not verify_password(user_data.password, user["password_hash"]):
+    if not user or not await verify_password(user_data.password, user["password_hash"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     if not user["is_active"]:
         raise HTTPException(status_code=401, detail="Account disabled")
     
+    # Upgrade the stored hash when the bcrypt cost changed
+    if password_hasher.needs_rehash(user["password_hash"]):
+        new_hash = await hash_password(user_data.password)
+        await db.users.update_one(
+            {"id": user["id"], "password_hash": user["password_hash"]},
+            {"$set": {"password_hash": new_hash}}
+        )
+        user_cache.invalidate(user["id"])
+    
     # Create access token
     access_token = create_access_token(data={"sub": user["id"]})
     
@@ -288,6 +737,8 @@ async def login(user_data: UserLogin):
 @api_router.post("/auth/select-username")
 async def select_username(
     username_data: UsernameSelect,
+    _ip: None = Depends(rate_limit_ip("select_username")),
+    _subject: None = Depends(rate_limit_token_subject("select_username")),
     current_user: User = Depends(get_current_user)
 ):
     """Select username after registration"""
@@ -297,19 +748,27 @@ async def select_username(
             detail="Username must be 3-30 characters, alphanumeric and underscore only"
         )
     
-    # Check if username already exists
-    existing_user = await db.users.find_one({"username": username_data.username})
-    if existing_user:
+    # Update user with username; the unique index rejects names already taken.
+    # The previous name comes from the stored document, not the (possibly stale) cached user
+    changes = {"username": username_data.username, "updated_at": datetime.utcnow()}
+    try:
+        previous_user = await db.users.find_one_and_update(
+            {"id": current_user.id},
+            {"$set": changes},
+            return_document=ReturnDocument.BEFORE
+        )
+    except DuplicateKeyError:
         raise HTTPException(status_code=400, detail="Username already taken")
+    if previous_user is None:
+        raise HTTPException(status_code=401, detail="User not found")
+    updated_user = {**previous_user, **changes}
     
-    # Update user with username
-    await db.users.update_one(
-        {"id": current_user.id},
-        {"$set": {"username": username_data.username, "updated_at": datetime.utcnow()}}
-    )
-    
-    # Get updated user
-    updated_user = await db.users.find_one({"id": current_user.id})
+    user_cache.invalidate(current_user.id)
+    # The feed embeds usernames, so its version moves too
+    scopes = [PROJECTS_SCOPE, user_scope(username_data.username)]
+    if previous_user["username"]:
+        scopes.append(user_scope(previous_user["username"]))
+    await version_store.bump(*scopes)
     
     return {
         "message": "Username set successfully",
@@ -323,23 +782,126 @@ async def get_current_user_profile(current_user: User = Depends(get_current_user
 
 # User Profile Routes
 @api_router.get("/users/{username}")
-async def get_user_profile(username: str):
+async def get_user_profile(username: str, request: Request, response: Response):
     """Get user profile by username"""
-    user = await db.users.find_one({"username": username})
+    scopes = (user_scope(username),)
+    not_modified = await conditional_etag(request, response, *scopes)
+    if not_modified:
+        return not_modified
+    
+    user = await public_read(
+        request, response, scopes,
+        lambda database, session: database.users.find_one({"username": username}, session=session)
+    )
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    return UserProfile(**user)
+    return trusted_json(read_user_profile(user), response)
 
 @api_router.get("/users/{username}/projects")
-async def get_user_projects(username: str):
+async def get_user_projects(
+    username: str,
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: Literal["summary", "full"] = "summary"
+):
     """Get projects by username"""
-    user = await db.users.find_one({"username": username})
-    if not user:
+    scopes = (user_scope(username), VIEWS_SCOPE)
+    not_modified = await conditional_etag(request, response, *scopes)
+    if not_modified:
+        return not_modified
+    
+    projection, read = project_list_view(view)
+    
+    async def read_projects(database, session):
+        user = await database.users.find_one({"username": username}, {"_id": 0, "id": 1}, session=session)
+        if not user:
+            return None
+        projects, next_cursor = await paginate_projects(
+            database, {"user_id": user["id"]}, cursor, limit, projection, session=session
+        )
+        return [read(project) for project in projects], next_cursor
+    
+    result = await public_read(request, response, scopes, read_projects)
+    if result is None:
         raise HTTPException(status_code=404, detail="User not found")
+    items, next_cursor = result
+    set_next_cursor(response, next_cursor)
+    return trusted_json(items, response)
+
+@api_router.get("/users/{username}/page")
+async def get_user_page(
+    username: str,
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+):
+    """Profile, one page of project summaries and totals over all projects, in a single aggregation"""
+    scopes = (user_scope(username), VIEWS_SCOPE)
+    not_modified = await conditional_etag(request, response, *scopes)
+    if not_modified:
+        return not_modified
     
-    projects = await db.hover_items.find({"user_id": user["id"]}).to_list(1000)
-    return [HoverItem(**project) for project in projects]
+    project_match = {"$expr": {"$eq": ["$user_id", "$$user_id"]}}
+    if cursor:
+        created_at, item_id = decode_cursor(cursor)
+        project_match["$or"] = [
+            {"created_at": {"$gt": created_at}},
+            {"created_at": created_at, "id": {"$gt": item_id}},
+        ]
+    pipeline = [
+        {"$match": {"username": username}},
+        {"$limit": 1},
+        {"$lookup": {
+            "from": "hover_items",
+            "let": {"user_id": "$id"},
+            "pipeline": [
+                {"$match": project_match},
+                {"$sort": {"created_at": 1, "id": 1}},
+                {"$limit": limit + 1},
+                {"$project": SUMMARY_PROJECTION},
+            ],
+            "as": "projects"
+        }},
+        # Project count and total views, so the client need not page through every project
+        {"$lookup": {
+            "from": "hover_items",
+            "let": {"user_id": "$id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$user_id", "$$user_id"]}}},
+                {"$group": {"_id": None, "projects": {"$sum": 1}, "views": {"$sum": "$views"}}},
+            ],
+            "as": "totals"
+        }},
+        {"$project": {"_id": 0, "projects": 1, "totals": 1, **{field: 1 for field in UserProfile.model_fields}}},
+    ]
+    
+    pages = await public_read(
+        request, response, scopes,
+        lambda database, session: database.users.aggregate(pipeline, session=session).to_list(1)
+    )
+    if not pages:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    page = pages[0]
+    projects = page["projects"]
+    totals = page["totals"][0] if page["totals"] else {"projects": 0, "views": 0}
+    next_cursor = None
+    if len(projects) > limit:
+        projects = projects[:limit]
+        next_cursor = encode_cursor(projects[-1]["created_at"], projects[-1]["id"])
+    set_next_cursor(response, next_cursor)
+    
+    return trusted_json({
+        "user": read_user_profile(page),
+        "projects": [read_hover_item_summary(project) for project in projects],
+        "next_cursor": next_cursor,
+        "project_count": totals["projects"],
+        "total_views": totals["views"]
+    }, response)
 
 @api_router.put("/users/me")
 async def update_profile(
@@ -350,37 +912,273 @@ async def update_profile(
     update_data = {k: v for k, v in user_update.dict().items() if v is not None}
     update_data["updated_at"] = datetime.utcnow()
     
-    await db.users.update_one(
+    updated_user = await db.users.find_one_and_update(
         {"id": current_user.id},
-        {"$set": update_data}
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER
     )
     
-    updated_user = await db.users.find_one({"id": current_user.id})
+    user_cache.invalidate(current_user.id)
+    if updated_user is None:
+        # Deleted while still in the user cache
+        raise HTTPException(status_code=401, detail="User not found")
+    # The feed embeds names and avatars, so its version moves too. The scope key
+    # comes from the stored document, since the cached user may be stale
+    scopes = [PROJECTS_SCOPE]
+    if updated_user["username"]:
+        scopes.append(user_scope(updated_user["username"]))
+    await version_store.bump(*scopes)
+    
     return UserProfile(**updated_user)
 
 # Portfolio Routes (updated with authentication)
 @api_router.get("/projects")
-async def get_all_projects():
-    """Get all public projects"""
-    await init_sample_data()
-    projects = await db.hover_items.find().to_list(1000)
-    return [HoverItem(**project) for project in projects]
+async def get_all_projects(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: Literal["summary", "full"] = "summary",
+    category: Optional[str] = None,
+    tech_stack: Optional[List[str]] = Query(None),
+    project_status: Optional[str] = Query(None, alias="status")
+):
+    """Get all public projects, each with an embedded author block"""
+    scopes = (PROJECTS_SCOPE, VIEWS_SCOPE)
+    not_modified = await conditional_etag(request, response, *scopes)
+    if not_modified:
+        return not_modified
+    
+    projection, read = project_list_view(view)
+    query = project_filters(category, tech_stack, project_status)
+    
+    async def read_feed(database, session):
+        projects, next_cursor = await paginate_projects(database, query, cursor, limit, projection, session=session)
+        items = await attach_authors(database, [read(project) for project in projects], session=session)
+        return items, next_cursor
+    
+    items, next_cursor = await public_read(request, response, scopes, read_feed)
+    set_next_cursor(response, next_cursor)
+    return trusted_json(items, response)
 
-@api_router.get("/projects/{project_id}")
-async def get_project(project_id: str):
-    """Get specific project and increment views"""
-    project = await db.hover_items.find_one({"id": project_id})
+@api_router.get("/projects/facets")
+async def get_project_facets(
+    request: Request,
+    response: Response,
+    category: Optional[str] = None,
+    tech_stack: Optional[List[str]] = Query(None),
+    project_status: Optional[str] = Query(None, alias="status")
+):
+    """Count of projects per category, tech_stack and status value under the given filters"""
+    not_modified = await conditional_etag(request, response, PROJECTS_SCOPE)
+    if not_modified:
+        return not_modified
+    
+    cache_key = response.headers["ETag"]
+    facets = facet_cache.get(cache_key)
+    if facets is None:
+        pipeline = [
+            {"$match": project_filters(category, tech_stack, project_status)},
+            {"$facet": {
+                field: [
+                    *([{"$unwind": f"${field}"}] if field == "tech_stack" else []),
+                    {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+                    {"$sort": {"count": -1, "_id": 1}},
+                ]
+                for field in FACET_FIELDS
+            }},
+        ]
+        result = await db.hover_items.aggregate(pipeline).to_list(1)
+        facets = {
+            field: [{"value": bucket["_id"], "count": bucket["count"]} for bucket in result[0][field]]
+            for field in FACET_FIELDS
+        }
+        facet_cache.set(cache_key, facets)
+    
+    return trusted_json(facets, response)
+
+async def stream_ndjson(cursor, chunk_rows: int):
+    """Yield NDJSON in chunks of chunk_rows lines"""
+    lines = []
+    async for project in cursor:
+        lines.append(orjson.dumps(read_hover_item(project)))
+        if len(lines) >= chunk_rows:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+async def stream_csv(cursor, chunk_rows: int):
+    """Yield CSV chunks; list fields are JSON-encoded in their cell"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    fields = list(HoverItem.model_fields)
+    writer.writerow(fields)
+    rows = 0
+    async for project in cursor:
+        item = read_hover_item(project)
+        writer.writerow([
+            json.dumps(item[field]) if isinstance(item[field], list)
+            else item[field].isoformat() if isinstance(item[field], datetime)
+            else item[field]
+            for field in fields
+        ])
+        rows += 1
+        if rows >= chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    yield buffer.getvalue()
+
+@api_router.get("/projects/export")
+async def export_projects(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    user_id: Optional[str] = None,
+    category: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    batch_size: int = Query(EXPORT_BATCH_SIZE, ge=1, le=10000)
+):
+    """Stream every matching project straight from a Mongo cursor"""
+    query = {}
+    if user_id:
+        query["user_id"] = user_id
+    if category:
+        query["category"] = category
+    if created_after or created_before:
+        query["created_at"] = {}
+        if created_after:
+            query["created_at"]["$gte"] = created_after
+        if created_before:
+            query["created_at"]["$lt"] = created_before
+    
+    cursor = db.hover_items.find(query, FULL_PROJECTION).sort(
+        [("created_at", 1), ("id", 1)]
+    ).batch_size(batch_size)
+    
+    if format == "csv":
+        return StreamingResponse(
+            stream_csv(cursor, batch_size),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="projects.csv"'}
+        )
+    return StreamingResponse(
+        stream_ndjson(cursor, batch_size),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="projects.ndjson"'}
+    )
+
+@api_router.get("/projects/search")
+async def search_projects(
+    q: str = Query(..., min_length=1, max_length=200),
+    prefix: bool = False,
+    limit: int = Query(SEARCH_DEFAULT_LIMIT, ge=1, le=MAX_PAGE_SIZE),
+    view: Literal["summary", "full"] = "summary"
+):
+    """Search projects; prefix=true treats the last word as a prefix for type-ahead"""
+    projection, read = project_list_view(view)
+    
+    if prefix:
+        query = prefix_query(q)
+        if query is None:
+            return trusted_json([])
+        projects = await db.hover_items.find(query, projection).limit(limit).to_list(limit)
+    else:
+        # Ranked by the weighted text index
+        score = {"score": {"$meta": "textScore"}}
+        projects = await db.hover_items.find(
+            {"$text": {"$search": q}},
+            {**projection, **score}
+        ).sort([("score", {"$meta": "textScore"})]).limit(limit).to_list(limit)
+    
+    return trusted_json([read(project) for project in projects])
+
+@api_router.get("/projects/trending")
+async def get_trending_projects(limit: int = Query(20, ge=1, le=TRENDING_TOP_N)):
+    """Most viewed projects with recent views weighted higher, from the precomputed ranking"""
+    ranking = await read_coalescer.do(
+        ("trending",),
+        lambda: db.app_meta.find_one({"_id": TRENDING_ID}, {"_id": 0, "items": 1})
+    )
+    items = (ranking or {}).get("items", [])[:limit]
+    return trusted_json([
+        {**read_hover_item_summary(item["project"]), "trending_score": item["score"], "window_views": item["window_views"]}
+        for item in items
+    ])
+
+@api_router.get("/projects/{project_id}/stats")
+async def get_project_stats(
+    project_id: str,
+    hours: int = Query(TRENDING_WINDOW_HOURS, ge=1, le=VIEW_BUCKET_RETENTION_HOURS)
+):
+    """Total views and hourly view counts for a project over the last ``hours`` hours"""
+    project = await db.hover_items.find_one({"id": project_id}, {"_id": 0, "views": 1})
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    # Increment views
-    await db.hover_items.update_one(
-        {"id": project_id},
-        {"$inc": {"views": 1}}
+    since = bucket_hour(datetime.utcnow()) - timedelta(hours=hours - 1)
+    buckets = await db.project_view_buckets.find(
+        {"project_id": project_id, "hour": {"$gte": since}},
+        {"_id": 0, "hour": 1, "count": 1}
+    ).sort("hour", 1).to_list(hours)
+    
+    return trusted_json({
+        "project_id": project_id,
+        "views": project.get("views", 0) + view_counter.unflushed(project_id),
+        "window_hours": hours,
+        "window_views": sum(bucket["count"] for bucket in buckets),
+        "buckets": buckets
+    })
+
+async def record_view(project_id: str):
+    """Count a view whose body was not re-sent (304), only for projects that exist"""
+    if settings.view_counter_mode == "strict":
+        result = await db.hover_items.update_one({"id": project_id}, {"$inc": {"views": 1}})
+        if result.matched_count:
+            view_counter.record_bucket(project_id)
+        return
+    # A matching tag does not prove the id exists (tags derive from the path);
+    # this lookup is covered by the id_unique index
+    if await db.hover_items.find_one({"id": project_id}, {"_id": 0, "id": 1}):
+        view_counter.record(project_id)
+
+@api_router.get("/projects/{project_id}")
+async def get_project(project_id: str, request: Request, response: Response):
+    """Get specific project and increment views"""
+    # The weak tag moves with content edits and view flushes; a revalidated copy
+    # may lag this worker's buffered views by at most one flush interval
+    not_modified = await conditional_etag(request, response, PROJECTS_SCOPE, VIEWS_SCOPE)
+    if not_modified:
+        await record_view(project_id)
+        return not_modified
+    
+    if settings.view_counter_mode == "strict":
+        # Exact count: increment and read back in one round trip
+        project = await db.hover_items.find_one_and_update(
+            {"id": project_id},
+            {"$inc": {"views": 1}},
+            projection=FULL_PROJECTION,
+            return_document=ReturnDocument.AFTER
+        )
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+        view_counter.record_bucket(project_id)
+        return trusted_json(read_hover_item(project), response)
+    
+    # Concurrent requests for the same project share one find_one
+    project = await read_coalescer.do(
+        ("project", project_id),
+        lambda: db.hover_items.find_one({"id": project_id}, FULL_PROJECTION)
     )
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
     
-    project["views"] += 1
-    return HoverItem(**project)
+    # The document may be shared, so adjust views on the shaped copy.
+    # Views are flushed in batches; add the ones still buffered
+    item = read_hover_item(project)
+    item["views"] += view_counter.record(project_id)
+    return trusted_json(item, response)
 
 @api_router.post("/projects")
 async def create_project(
@@ -389,7 +1187,11 @@ async def create_project(
 ):
     """Create a new project"""
     project = HoverItem(user_id=current_user.id, **project_data.dict())
-    await db.hover_items.insert_one(project.dict())
+    _, scopes = await asyncio.gather(
+        db.hover_items.insert_one(project_document(project)),
+        project_scopes(current_user.id)
+    )
+    await bump_project_versions(scopes)
     return project
 
 @api_router.put("/projects/{project_id}")
@@ -399,20 +1201,63 @@ async def update_project(
     current_user: User = Depends(get_current_user)
 ):
     """Update a project"""
-    project = await db.hover_items.find_one({"id": project_id})
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    update_data = project_data.dict()
+    update_data["search_tokens"] = search_tokens(update_data)
+    
+    # Ownership is part of the filter and the scope lookup runs alongside, so a
+    # successful update takes two sequential round trips: the write, then the bump
+    updated_project, scopes = await asyncio.gather(
+        db.hover_items.find_one_and_update(
+            {"id": project_id, "user_id": current_user.id},
+            {"$set": update_data},
+            projection=FULL_PROJECTION,
+            return_document=ReturnDocument.AFTER
+        ),
+        project_scopes(current_user.id)
+    )
+    if updated_project is None:
+        await raise_project_write_error(project_id, "update")
     
-    if project["user_id"] != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized to update this project")
+    await bump_project_versions(scopes, project_id)
+    return HoverItem(**updated_project)
+
+@api_router.patch("/projects/{project_id}")
+async def patch_project(
+    project_id: str,
+    project_data: HoverItemUpdate,
+    current_user: User = Depends(get_current_user)
+):
+    """Partially update a project; an explicit null clears an optional link"""
+    update_data = project_data.dict(exclude_unset=True)
+    if not update_data:
+        raise HTTPException(status_code=400, detail="No fields to update")
+    required_nulls = sorted(k for k, v in update_data.items() if v is None and k not in CLEARABLE_PROJECT_FIELDS)
+    if required_nulls:
+        raise HTTPException(status_code=400, detail=f"Fields cannot be null: {', '.join(required_nulls)}")
     
-    update_data = project_data.dict()
-    await db.hover_items.update_one(
-        {"id": project_id},
-        {"$set": update_data}
+    updated_project, scopes = await asyncio.gather(
+        db.hover_items.find_one_and_update(
+            {"id": project_id, "user_id": current_user.id},
+            {"$set": update_data},
+            projection=FULL_PROJECTION,
+            return_document=ReturnDocument.AFTER
+        ),
+        project_scopes(current_user.id)
     )
+    if updated_project is None:
+        await raise_project_write_error(project_id, "update")
     
-    updated_project = await db.hover_items.find_one({"id": project_id})
+    writes = [bump_project_versions(scopes, project_id)]
+    # Search tokens depend on fields this body may not carry; refresh them from the result.
+    # Only write them while those fields are unchanged, so an interleaved older PATCH
+    # cannot land its tokens last; the newer PATCH writes tokens for the final values.
+    # No response body carries the tokens, so this runs alongside the version bump
+    if any(field in update_data for field in SEARCH_WEIGHTS):
+        writes.append(db.hover_items.update_one(
+            {"id": project_id, **{field: updated_project.get(field) for field in SEARCH_WEIGHTS}},
+            {"$set": {"search_tokens": search_tokens(updated_project)}}
+        ))
+    await asyncio.gather(*writes)
     return HoverItem(**updated_project)
 
 @api_router.delete("/projects/{project_id}")
@@ -421,50 +1266,322 @@ async def delete_project(
     current_user: User = Depends(get_current_user)
 ):
     """Delete a project"""
-    project = await db.hover_items.find_one({"id": project_id})
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    result, scopes = await asyncio.gather(
+        db.hover_items.delete_one({"id": project_id, "user_id": current_user.id}),
+        project_scopes(current_user.id)
+    )
+    if result.deleted_count == 0:
+        await raise_project_write_error(project_id, "delete")
+    
+    await bump_project_versions(scopes, project_id)
+    return {"deleted": True}
+
+@api_router.post("/projects/bulk")
+async def bulk_projects(
+    bulk_request: ProjectBulkRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """Create, update and delete several of the current user's projects in one bulk_write"""
+    operations = bulk_request.operations
+    results = [{"index": i, "op": op.op, "id": op.id} for i, op in enumerate(operations)]
+    
+    def fail(i: int, status_code: int, error):
+        results[i].update({"status": status_code, "error": error})
+    
+    # Validation pass
+    payloads = {}
+    seen_ids = set()
+    for i, op in enumerate(operations):
+        if op.op in ("update", "delete"):
+            if not op.id:
+                fail(i, 400, "id is required")
+                continue
+            if op.id in seen_ids:
+                fail(i, 400, "Project appears more than once in this batch")
+                continue
+            seen_ids.add(op.id)
+        if op.op in ("create", "update"):
+            try:
+                payloads[i] = HoverItemCreate.model_validate(op.data or {})
+            except ValidationError as exc:
+                fail(i, 422, exc.errors(include_url=False))
+    
+    # Ownership pass: one $in query for every referenced project, alongside the scope lookup
+    target_ids = [op.id for i, op in enumerate(operations)
+                  if op.op != "create" and "error" not in results[i]]
+    
+    async def find_owners():
+        owners = {}
+        if target_ids:
+            async for project in db.hover_items.find({"id": {"$in": target_ids}}, {"_id": 0, "id": 1, "user_id": 1}):
+                owners[project["id"]] = project["user_id"]
+        return owners
+    
+    owners, scopes = await asyncio.gather(find_owners(), project_scopes(current_user.id))
+    
+    requests = []
+    request_index = []
+    for i, op in enumerate(operations):
+        if "error" in results[i]:
+            continue
+        if op.op == "create":
+            project = HoverItem(user_id=current_user.id, **payloads[i].dict())
+            results[i]["id"] = project.id
+            requests.append(InsertOne(project_document(project)))
+        elif op.id not in owners:
+            fail(i, 404, "Project not found")
+            continue
+        elif owners[op.id] != current_user.id:
+            fail(i, 403, f"Not authorized to {op.op} this project")
+            continue
+        elif op.op == "update":
+            update_data = payloads[i].dict()
+            update_data["search_tokens"] = search_tokens(update_data)
+            requests.append(UpdateOne({"id": op.id, "user_id": current_user.id}, {"$set": update_data}))
+        else:
+            requests.append(DeleteOne({"id": op.id, "user_id": current_user.id}))
+        request_index.append(i)
+    
+    write_errors = []
+    if requests:
+        try:
+            await db.hover_items.bulk_write(requests, ordered=False)
+        except BulkWriteError as exc:
+            write_errors = exc.details.get("writeErrors", [])
+        for error in write_errors:
+            fail(request_index[error["index"]], 409 if error.get("code") == 11000 else 500, error.get("errmsg"))
     
-    if project["user_id"] != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized to delete this project")
+    succeeded = 0
+    for i in request_index:
+        if "error" not in results[i]:
+            results[i]["status"] = 201 if operations[i].op == "create" else 200
+            succeeded += 1
     
-    result = await db.hover_items.delete_one({"id": project_id})
-    return {"deleted": result.deleted_count > 0}
+    if succeeded:
+        await bump_project_versions(
+            scopes,
+            *(operations[i].id for i in request_index if operations[i].op != "create")
+        )
+    
+    return {"succeeded": succeeded, "failed": len(operations) - succeeded, "results": results}
 
 # Legacy routes for backward compatibility
 @api_router.get("/hover-items")
-async def get_hover_items():
+async def get_hover_items(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: Literal["summary", "full"] = "full"
+):
     """Legacy route - get all projects"""
-    return await get_all_projects()
+    return await get_all_projects(
+        request, response, cursor, limit, view,
+        category=None, tech_stack=None, project_status=None
+    )
 
 @api_router.get("/hover-items/{item_id}")
-async def get_hover_item(item_id: str):
+async def get_hover_item(item_id: str, request: Request, response: Response):
     """Legacy route - get specific project"""
-    return await get_project(item_id)
+    return await get_project(item_id, request, response)
+
+# Cache statistics
+@api_router.get("/stats/cache")
+async def get_cache_stats():
+    """Hit/miss counters for the in-process caches"""
+    return {
+        "user_cache": user_cache.stats(),
+        "token_cache": token_cache.stats(),
+        "facet_cache": facet_cache.stats(),
+        "read_coalescing": read_coalescer.stats()
+    }
+
+# Database health
+@api_router.get("/health/db")
+async def get_db_health():
+    """Ping latency, pool utilization and checkout wait times per server"""
+    started = time.perf_counter()
+    try:
+        await client.admin.command("ping")
+    except Exception as e:
+        logger.warning("Database health ping failed: %s", e)
+        return ORJSONResponse({"status": "unavailable", "error": str(e)}, status_code=503)
+    return {
+        "status": "ok",
+        "ping_ms": round((time.perf_counter() - started) * 1000, 3),
+        "public_read_preference": settings.mongo_public_read_preference,
+        "route_read_preferences": settings.mongo_route_read_preferences,
+        "pool": mongo_pool_metrics.snapshot(settings.mongo_max_pool_size)
+    }
+
+# Load shedding statistics
+@api_router.get("/stats/load")
+async def get_load_stats(request: Request):
+    """Current limit, in-flight, queued and rejected counts per route group"""
+    return {group: limiter.stats() for group, limiter in request.app.state.shed_limiters.items()}
 
 # Root route
 @api_router.get("/")
 async def root():
     return {"message": "HoverBoard API dengan Authentication Ready! 🚀"}
 
-# Include the router in the main app
-app.include_router(api_router)
+# Prometheus scrape endpoint (outside /api)
+root_router = APIRouter()
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_credentials=True,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+@root_router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    return PlainTextResponse(
+        metrics.render(http_metrics, mongo_metrics, mongo_pool_metrics),
+        media_type=metrics.CONTENT_TYPE
+    )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+# Application lifecycle
+async def open_resources(app_settings: Settings):
+    """Create the Mongo client, worker pools and caches, and warm the connection pool"""
+    global settings, client, db, public_dbs, view_counter, version_store
+    global read_coalescer, facet_cache
+    global trending_rollup, password_hasher, user_cache, token_cache
+    global rate_limiter, ip_rate_limit, email_rate_limit
+    
+    settings = app_settings
+    pool_options = {
+        "maxPoolSize": app_settings.mongo_max_pool_size,
+        "minPoolSize": app_settings.mongo_min_pool_size,
+    }
+    if app_settings.mongo_wait_queue_timeout_ms:
+        pool_options["waitQueueTimeoutMS"] = app_settings.mongo_wait_queue_timeout_ms
+    if app_settings.mongo_compressors:
+        pool_options["compressors"] = app_settings.mongo_compressors
+    client = AsyncIOMotorClient(
+        app_settings.mongo_url,
+        event_listeners=[mongo_metrics, mongo_pool_metrics],
+        **pool_options
+    )
+    db = client[app_settings.db_name]
+    public_dbs = {
+        name: client.get_database(app_settings.db_name, read_preference=READ_PREFERENCES[name])
+        for name in {app_settings.mongo_public_read_preference, *app_settings.mongo_route_read_preferences.values()}
+    }
+    # Concurrent pings each check out a connection, so the pool opens several up front
+    await asyncio.gather(*(
+        client.admin.command("ping") for _ in range(max(1, app_settings.mongo_warm_connections))
+    ))
+    
+    version_store = VersionStore(db.app_meta)
+    view_counter = ViewCounter(
+        db.hover_items,
+        flush_interval_ms=app_settings.view_flush_interval_ms,
+        flush_max_events=app_settings.view_flush_max_events,
+        bucket_collection=db.project_view_buckets,
+        version_store=version_store
+    )
+    trending_rollup = TrendingRollup(
+        db,
+        SUMMARY_PROJECTION,
+        interval_seconds=app_settings.trending_rollup_interval_seconds,
+        window_hours=app_settings.trending_window_hours,
+        half_life_hours=app_settings.trending_half_life_hours,
+        top_n=app_settings.trending_top_n
+    )
+    read_coalescer = SingleFlight(
+        cache_ttl=app_settings.coalesce_cache_ttl_seconds,
+        cache_size=app_settings.coalesce_cache_size
+    )
+    facet_cache = TTLCache(maxsize=256, ttl=app_settings.facet_cache_ttl_seconds)
+    password_hasher = PasswordHasher(
+        rounds=app_settings.bcrypt_rounds,
+        max_workers=app_settings.password_hash_workers,
+        max_pending=app_settings.password_hash_max_pending
+    )
+    user_cache = TTLCache(maxsize=app_settings.user_cache_max_size, ttl=app_settings.user_cache_ttl_seconds)
+    token_cache = TTLCache(
+        maxsize=app_settings.token_cache_max_size if app_settings.token_cache_enabled else 0,
+        ttl=app_settings.token_cache_ttl_seconds
+    )
+    rate_limiter = None
+    if app_settings.rate_limit_enabled:
+        rate_limiter = RateLimiter(MemoryRateLimitBackend(max_keys=app_settings.rate_limit_max_keys))
+        ip_rate_limit = RateLimit(app_settings.rate_limit_ip_per_minute, app_settings.rate_limit_ip_burst)
+        email_rate_limit = RateLimit(app_settings.rate_limit_email_per_minute, app_settings.rate_limit_email_burst)
+    
+    await ensure_indexes(db)
+    await backfill_search_tokens(db.hover_items)
+    view_counter.start()
+    trending_rollup.start()
+    if app_settings.seed_sample_data and await seed_sample_data_once():
+        logger.info("Sample data seeded")
+
+async def close_resources():
+    """Stop background work, flush buffered views and close the pools"""
+    await trending_rollup.stop()
+    await view_counter.stop()
+    password_hasher.shutdown()
+    client.close()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+    await open_resources(app.state.settings)
+    http_metrics.startup.set(time.perf_counter() - started)
+    logger.info("Started in %.0f ms", (time.perf_counter() - started) * 1000)
+    try:
+        yield
+    finally:
+        await close_resources()
+
+def create_app(app_settings: Optional[Settings] = None) -> FastAPI:
+    """Build the ASGI app; resources are opened by its lifespan, not at import"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    app_settings = app_settings or settings
+    
+    # Create the main app without a prefix
+    app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+    app.state.settings = app_settings
+    
+    # Include the routers in the main app
+    app.include_router(api_router)
+    app.include_router(root_router)
+    
+    # Innermost, so shed responses still carry CORS headers and show up in metrics
+    app.state.shed_limiters = {}
+    if app_settings.shed_enabled:
+        target_p95 = app_settings.shed_target_p95_ms / 1000 if app_settings.shed_adaptive else None
+        app.state.shed_limiters = {
+            group: ConcurrencyLimiter(
+                limit,
+                queue_timeout=app_settings.shed_queue_timeout_ms / 1000,
+                target_p95=target_p95
+            )
+            for group, limit in app_settings.shed_group_limits.items()
+        }
+        app.add_middleware(
+            LoadSheddingMiddleware,
+            limiters=app.state.shed_limiters,
+            route_groups=SHED_ROUTE_GROUPS,
+            unlimited=SHED_UNLIMITED_PATHS
+        )
+    
+    app.add_middleware(
+        CORSMiddleware,
+        allow_credentials=True,
+        allow_origins=["*"],
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
+    )
+    
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=app_settings.compression_min_size,
+        level=app_settings.compression_level,
+        route_levels=app_settings.compression_route_levels,
+        cache_size=app_settings.compression_cache_size
+    )
+    
+    app.add_middleware(metrics.MetricsMiddleware, metrics=http_metrics)
+    return app
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+app = create_app()
@@ -0,0 +1,144 @@
+"""Process settings, read once from the environment (and backend/.env) and validated"""
+import os
+from pathlib import Path
+from typing import Dict, Literal, Mapping, Optional
+
+from dotenv import load_dotenv
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+ROOT_DIR = Path(__file__).parent
+
+ReadPreferenceName = Literal['primary', 'primaryPreferred', 'secondary', 'secondaryPreferred', 'nearest']
+
+
+class Settings(BaseModel):
+    """Every field maps to the upper-cased environment variable of the same name"""
+
+    model_config = ConfigDict(frozen=True)
+
+    # MongoDB
+    mongo_url: str
+    db_name: str
+    # Connection pool; compressors is a comma-separated list of snappy, zlib, zstd
+    mongo_max_pool_size: int = Field(100, ge=1)
+    mongo_min_pool_size: int = Field(0, ge=0)
+    mongo_wait_queue_timeout_ms: Optional[int] = Field(None, ge=1)
+    mongo_compressors: str = ''
+    # Read preference for anonymous profile and feed reads; auth and writes always use the
+    # primary. Off the primary, those reads share a causally consistent session with the
+    # version read that builds their ETag, so a tag never outruns its body.
+    mongo_public_read_preference: ReadPreferenceName = 'primary'
+    # Per-route overrides as "route=preference" pairs, e.g. "/api/projects=secondaryPreferred"
+    mongo_route_read_preferences: Dict[str, ReadPreferenceName] = {}
+    # Concurrent pings sent at startup (at least one) so the pool holds open connections before traffic
+    mongo_warm_connections: int = Field(4, ge=0)
+
+    # JWT
+    jwt_secret: str = 'your-secret-key-here'
+
+    # Password hashing
+    bcrypt_rounds: int = Field(12, ge=4, le=31)
+    password_hash_workers: int = Field(default_factory=lambda: min(4, os.cpu_count() or 1), ge=1)
+    password_hash_max_pending: int = Field(64, ge=1)
+
+    # Caches for get_current_user (token cache is opt-in)
+    user_cache_ttl_seconds: float = Field(30, ge=0)
+    user_cache_max_size: int = Field(10000, ge=0)
+    token_cache_enabled: bool = False
+    token_cache_ttl_seconds: float = Field(300, ge=0)
+    token_cache_max_size: int = Field(10000, ge=0)
+
+    # View counter ("batched" write-behind or "strict" per-view update)
+    view_counter_mode: Literal['batched', 'strict'] = 'batched'
+    view_flush_interval_ms: int = Field(1000, gt=0)
+    view_flush_max_events: int = Field(500, gt=0)
+
+    # Pagination, search, facets, bulk writes and export
+    default_page_size: int = Field(50, ge=1)
+    max_page_size: int = Field(200, ge=1)
+    search_default_limit: int = Field(20, ge=1)
+    facet_cache_ttl_seconds: float = Field(60, ge=0)
+    bulk_max_operations: int = Field(500, ge=1)
+    export_batch_size: int = Field(500, ge=1)
+
+    # Compression; route levels come from "route=level" pairs, e.g. "/api/projects/export=1,/api/projects=6"
+    compression_min_size: int = Field(1024, ge=0)
+    compression_level: int = Field(6, ge=0, le=11)
+    compression_cache_size: int = Field(256, ge=0)
+    compression_route_levels: Dict[str, int] = {'/api/projects/export': 1}
+
+    # Read coalescing (a TTL of 0 only merges concurrent reads)
+    coalesce_cache_ttl_seconds: float = Field(0, ge=0)
+    coalesce_cache_size: int = Field(1024, ge=0)
+
+    # Trending (rankings decay with a half-life over hourly view buckets)
+    trending_rollup_interval_seconds: float = Field(60, gt=0)
+    trending_window_hours: int = Field(168, ge=1)
+    trending_half_life_hours: float = Field(24, gt=0)
+    trending_top_n: int = Field(50, ge=1)
+
+    # Load shedding: concurrency limit per route group as "group=limit" pairs
+    # (groups: auth, export, reads, default) and how long a request may queue for a slot
+    shed_enabled: bool = True
+    shed_group_limits: Dict[str, int] = {'auth': 16, 'export': 4, 'reads': 64, 'default': 32}
+    shed_queue_timeout_ms: int = Field(500, ge=0)
+    # Adaptive mode shrinks a group's limit while its p95 service time is over target
+    shed_adaptive: bool = False
+    shed_target_p95_ms: float = Field(250, gt=0)
+
+    # Auth rate limits (register, login, select-username): sustained requests per minute and
+    # burst, per client IP and per account (email, or token subject for select-username).
+    # rate_limit_trusted_proxies is the number of proxies in front of the app that append to
+    # X-Forwarded-For; the client IP is read that many entries from the right (0 ignores it).
+    rate_limit_enabled: bool = True
+    rate_limit_ip_per_minute: float = Field(30, gt=0)
+    rate_limit_ip_burst: int = Field(10, ge=1)
+    rate_limit_email_per_minute: float = Field(5, gt=0)
+    rate_limit_email_burst: int = Field(5, ge=1)
+    rate_limit_max_keys: int = Field(100000, ge=1)
+    rate_limit_trusted_proxies: int = Field(0, ge=0)
+
+    # Sample data seeding (disable in production with SEED_SAMPLE_DATA=false); a lock stuck
+    # at "seeding" this long is assumed to belong to a dead worker and is taken over
+    seed_sample_data: bool = True
+    seed_lock_timeout_seconds: float = Field(600, gt=0)
+
+    @field_validator('compression_route_levels', 'shed_group_limits', 'mongo_route_read_preferences', mode='before')
+    @classmethod
+    def _parse_pairs(cls, value):
+        if not isinstance(value, str):
+            return value
+        return {
+            route.strip(): level.strip()
+            for route, _, level in (pair.partition('=') for pair in value.split(','))
+            if route.strip() and level.strip()
+        }
+
+    @field_validator('mongo_wait_queue_timeout_ms', mode='before')
+    @classmethod
+    def _blank_is_unset(cls, value):
+        return None if value == '' else value
+
+    @field_validator('mongo_compressors')
+    @classmethod
+    def _check_compressors(cls, value: str):
+        names = [name.strip() for name in value.split(',') if name.strip()]
+        unknown = set(names) - {'snappy', 'zlib', 'zstd'}
+        if unknown:
+            raise ValueError(f"unknown compressors: {', '.join(sorted(unknown))}")
+        return ','.join(names)
+
+    @model_validator(mode='after')
+    def _check_pool_bounds(self):
+        if self.mongo_min_pool_size > self.mongo_max_pool_size:
+            raise ValueError('MONGO_MIN_POOL_SIZE must not exceed MONGO_MAX_POOL_SIZE')
+        return self
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None, env_file: Optional[Path] = ROOT_DIR / '.env'):
+        """Build settings from ``environ`` (os.environ by default) after loading ``env_file``"""
+        if environ is None:
+            if env_file is not None:
+                load_dotenv(env_file)
+            environ = os.environ
+        return cls(**{name: environ[name.upper()] for name in cls.model_fields if name.upper() in environ})
@@ -0,0 +1,166 @@
+"""Per-route-group concurrency limits with queue deadlines and adaptive (AIMD) limits"""
+import asyncio
+import math
+from collections import deque
+from time import perf_counter
+from typing import Deque, Dict, Iterable, Optional, Tuple
+
+import orjson
+
+DEFAULT_GROUP = "default"
+
+
+class ConcurrencyLimiter:
+    """At most ``limit`` requests run at once; others wait in FIFO order up to ``queue_timeout`` seconds.
+
+    With ``target_p95`` set, the limit adapts every ``window`` completed requests:
+    it shrinks by ``decrease`` when the window's p95 service time is over target
+    and grows by one when it is comfortably under, within [min_limit, max_limit].
+    """
+
+    def __init__(self, limit: int, queue_timeout: float, max_queue: Optional[int] = None,
+                 target_p95: Optional[float] = None, min_limit: int = 1, window: int = 100,
+                 decrease: float = 0.9):
+        self.limit = limit
+        self.max_limit = limit
+        self.min_limit = min(min_limit, limit)
+        self.queue_timeout = queue_timeout
+        self.max_queue = max_queue if max_queue is not None else limit * 4
+        self.target_p95 = target_p95
+        self.window = window
+        self.decrease = decrease
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._latencies = []
+
+    async def acquire(self) -> bool:
+        """Take a slot, waiting up to the queue deadline; False means shed the request"""
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return True
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the deadline passed; give it back
+                self.release()
+            else:
+                waiter.cancel()
+            self.rejected += 1
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                waiter.cancel()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        self.admitted += 1
+        return True
+
+    def release(self, elapsed: Optional[float] = None):
+        """Free a slot (handing it to the oldest waiter) and feed the adaptive limit"""
+        if elapsed is not None and self.target_p95 is not None:
+            self._observe(elapsed)
+        while self._waiters and self.in_flight <= self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # The slot passes directly to the waiter, so in_flight is unchanged
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def _observe(self, elapsed: float):
+        self._latencies.append(elapsed)
+        if len(self._latencies) < self.window:
+            return
+        latencies = sorted(self._latencies)
+        self._latencies = []
+        p95 = latencies[max(0, math.ceil(0.95 * len(latencies)) - 1)]
+        if p95 > self.target_p95:
+            self.limit = max(self.min_limit, int(self.limit * self.decrease))
+        elif p95 < self.target_p95 * 0.8:
+            self.limit = min(self.max_limit, self.limit + 1)
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "queued": len(self._waiters),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+
+class LoadSheddingMiddleware:
+    """Pure ASGI middleware mapping each request to a route group and its ConcurrencyLimiter.
+
+    ``route_groups`` is an ordered list of (group, method or None, path prefix);
+    the first match wins and unmatched requests use the "default" group.
+    Paths in ``unlimited`` bypass every limit so health checks and cheap
+    routes answer during overload. Shed requests get 503 with Retry-After.
+    """
+
+    def __init__(self, app, limiters: Dict[str, ConcurrencyLimiter],
+                 route_groups: Iterable[Tuple[str, Optional[str], str]] = (),
+                 unlimited: Iterable[str] = (), retry_after: int = 1):
+        self.app = app
+        self.limiters = limiters
+        self.route_groups = tuple(route_groups)
+        self.unlimited = frozenset(unlimited)
+        self.retry_after = str(retry_after)
+
+    def group_for(self, method: str, path: str) -> Optional[str]:
+        if path in self.unlimited:
+            return None
+        for group, group_method, prefix in self.route_groups:
+            if (group_method is None or group_method == method) and path.startswith(prefix):
+                return group
+        return DEFAULT_GROUP
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        group = self.group_for(scope["method"], scope["path"])
+        limiter = self.limiters.get(group) if group else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await limiter.acquire():
+            await self._reject(send)
+            return
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release(perf_counter() - start)
+
+    async def _reject(self, send):
+        body = orjson.dumps({"detail": "Server busy, please try again"})
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", self.retry_after.encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    def stats(self) -> Dict[str, dict]:
+        return {group: limiter.stats() for group, limiter in self.limiters.items()}
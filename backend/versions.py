@@ -0,0 +1,62 @@
+"""Version stamps for conditional (ETag) responses on public reads"""
+import hashlib
+from typing import Optional, Tuple
+
+from pymongo import UpdateOne
+
+VERSION_PREFIX = "version:"
+
+
+class VersionStore:
+    """Monotonic counters per scope (e.g. "projects", "user:<username>") kept in Mongo.
+
+    Stored in the database rather than in memory so every worker agrees on the
+    current version. Write handlers bump a scope after their write completes;
+    readers fetch the version before reading the data it describes.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def get(self, *scopes: str, session=None) -> Tuple[int, ...]:
+        ids = [VERSION_PREFIX + scope for scope in scopes]
+        docs = await self.collection.find({"_id": {"$in": ids}}, session=session).to_list(len(ids))
+        found = {doc["_id"]: doc.get("v", 0) for doc in docs}
+        return tuple(found.get(_id, 0) for _id in ids)
+
+    async def bump(self, *scopes: str):
+        if not scopes:
+            return
+        await self.collection.bulk_write(
+            [UpdateOne({"_id": VERSION_PREFIX + scope}, {"$inc": {"v": 1}}, upsert=True)
+             for scope in scopes],
+            ordered=False
+        )
+
+
+def make_etag(versions: Tuple[int, ...], *parts: str, weak: bool = False) -> str:
+    """ETag for a representation identified by its versions and request parts.
+
+    Use a weak tag when the body carries values the versions do not track
+    exactly, such as buffered view counts.
+    """
+    digest = hashlib.sha1("|".join(parts).encode('utf-8')).hexdigest()[:16]
+    tag = '"%s-%s"' % ("-".join(str(v) for v in versions), digest)
+    return "W/" + tag if weak else tag
+
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether the client's If-None-Match holds ``etag``.
+
+    "*" is deliberately not honoured: these are GETs whose resource may not
+    exist, and a wildcard would turn a 404 into a 304.
+    """
+    if not if_none_match:
+        return False
+    # If-None-Match uses weak comparison, so ignore a W/ prefix on either side
+    etag = _opaque(etag)
+    return any(_opaque(tag.strip()) == etag for tag in if_none_match.split(","))
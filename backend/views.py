@@ -0,0 +1,123 @@
+"""Write-behind view counters for project pages"""
+import asyncio
+import logging
+from collections import Counter
+from typing import Optional
+
+from pymongo import UpdateOne
+
+from analytics import bucket_updates
+
+logger = logging.getLogger(__name__)
+
+# Version scope bumped after each flush that changed stored view counts
+VIEWS_SCOPE = "views"
+
+
+class ViewCounter:
+    """Aggregates view increments in memory and flushes them with one bulk_write.
+
+    A flush happens every ``flush_interval_ms`` or as soon as ``flush_max_events``
+    views are pending, and once more on stop(). When ``bucket_collection`` is set,
+    the same flush adds the views to hourly per-project buckets. When
+    ``version_store`` is set, each flush that saved views (or followed strict-mode
+    increments) bumps VIEWS_SCOPE, so ETags over view counts move with them.
+    """
+
+    def __init__(self, collection, flush_interval_ms: int = 1000, flush_max_events: int = 500,
+                 bucket_collection=None, version_store=None):
+        self.collection = collection
+        self.bucket_collection = bucket_collection
+        self.version_store = version_store
+        self.flush_interval = flush_interval_ms / 1000
+        self.flush_max_events = flush_max_events
+        self._pending: Counter = Counter()
+        self._flushing: Counter = Counter()
+        # Views already counted on the document (strict mode) that still need a bucket
+        self._bucket_only: Counter = Counter()
+        self._events = 0
+        # Set once flush_max_events views are pending, waking _run early
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def record(self, project_id: str) -> int:
+        """Count one view and return the views not yet persisted for this project"""
+        self._pending[project_id] += 1
+        self._count_event()
+        return self.unflushed(project_id)
+
+    def record_bucket(self, project_id: str):
+        """Count a view in the hourly buckets only; the caller already incremented the document"""
+        self._bucket_only[project_id] += 1
+        self._count_event()
+
+    def _count_event(self):
+        self._events += 1
+        if self._events >= self.flush_max_events:
+            self._events = 0
+            self._wake.set()
+
+    def unflushed(self, project_id: str) -> int:
+        return self._pending[project_id] + self._flushing[project_id]
+
+    async def flush(self):
+        async with self._flush_lock:
+            if not self._pending and not self._bucket_only:
+                return
+            self._flushing, self._pending = self._pending, Counter()
+            bucket_only, self._bucket_only = self._bucket_only, Counter()
+            self._events = 0
+            bucket_counts = self._flushing + bucket_only
+            if self._flushing:
+                try:
+                    await self.collection.bulk_write(
+                        [UpdateOne({"id": project_id}, {"$inc": {"views": count}})
+                         for project_id, count in self._flushing.items()],
+                        ordered=False
+                    )
+                except Exception:
+                    # Keep the counts for the next flush instead of dropping them
+                    logger.exception("Failed to flush %d view counters", len(self._flushing))
+                    self._pending.update(self._flushing)
+                    self._bucket_only.update(bucket_only)
+                    return
+                finally:
+                    self._flushing = Counter()
+
+            if self.version_store is not None:
+                try:
+                    await self.version_store.bump(VIEWS_SCOPE)
+                except Exception:
+                    # Cached copies keep their old counts until the next flush bumps it
+                    logger.exception("Failed to bump the views version")
+
+            if self.bucket_collection is not None:
+                try:
+                    await self.bucket_collection.bulk_write(bucket_updates(bucket_counts), ordered=False)
+                except Exception:
+                    # Totals are already saved; a lost bucket only skews trending slightly
+                    logger.exception("Failed to flush %d view buckets", len(bucket_counts))
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
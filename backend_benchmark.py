@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Load-test and benchmark suite for the HoverBoard API.
+Seeds N users and M projects into a dedicated database, runs concurrent
+scenarios against the FastAPI app in-process (ASGI transport) or a running
+server, and prints p50/p95/p99 latency and throughput as JSON so results can
+be compared across commits.
+
+Usage:
+    python backend_benchmark.py --users 50 --projects 2000 --requests 500 --concurrency 20
+    python backend_benchmark.py --base-url http://localhost:8001 --db-name hoverboard_db
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT_DIR / "backend"))
+
+SCENARIOS = ("feed", "detail", "login", "write")
+PASSWORD = "BenchPass123!"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="HoverBoard API benchmark")
+    parser.add_argument("--base-url", help="Benchmark a running server instead of the in-process app")
+    parser.add_argument("--db-name", default="hoverboard_benchmark",
+                        help="Database to seed (must match the server's DB_NAME with --base-url)")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--projects", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=300, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS),
+                        help=f"Comma-separated subset of {', '.join(SCENARIOS)}")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for reproducible runs")
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded database afterwards")
+    parser.add_argument("--load-shedding", action="store_true",
+                        help="Keep load shedding on for the in-process app (off by default so runs stay comparable)")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    return parser.parse_args()
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class HoverBoardBenchmark:
+    def __init__(self, args, server):
+        self.args = args
+        self.server = server
+        self.random = random.Random(args.seed)
+        self.users: List[dict] = []
+        self.projects: List[dict] = []
+        self.tokens: Dict[str, str] = {}
+
+    async def seed(self):
+        """Insert users and projects directly; every user shares one precomputed password hash"""
+        server = self.server
+        db = server.db
+        await db.client.drop_database(db.name)
+        await server.ensure_indexes(db)
+
+        password_hash = await server.hash_password(PASSWORD)
+        now = datetime.utcnow()
+        for i in range(self.args.users):
+            user = server.User(
+                email=f"bench_{i}@hoverboard.com",
+                username=f"bench_user_{i}",
+                password_hash=password_hash,
+                full_name=f"Bench User {i}",
+                created_at=now,
+                updated_at=now
+            )
+            self.users.append(user.dict())
+            self.tokens[user.id] = server.create_access_token(data={"sub": user.id})
+        await db.users.insert_many([dict(user) for user in self.users])
+
+        categories = ["web", "app", "design", "data"]
+        stacks = ["React", "Node.js", "MongoDB", "FastAPI", "Tailwind CSS", "Next.js", "Redis"]
+        batch = []
+        for i in range(self.args.projects):
+            owner = self.users[i % len(self.users)]
+            project = server.HoverItem(
+                user_id=owner["id"],
+                title=f"Proyek Benchmark {i}",
+                subtitle="Solusi Full-stack",
+                description="Pengalaman belanja modern dengan integrasi pembayaran yang lengkap",
+                detailed_description="Platform e-commerce yang komprehensif dengan sistem pembayaran terintegrasi. " * 5,
+                category=categories[i % len(categories)],
+                image_url="https://images.unsplash.com/photo-1556742049-0cfed4f6a45d?w=400&h=300&fit=crop",
+                gallery_images=["https://images.unsplash.com/photo-1563013544-824ae1b704d3?w=600&h=400&fit=crop"],
+                hover_content="Solusi e-commerce lengkap dengan integrasi Stripe.",
+                fun_fact="Memproses lebih dari 1000 pesanan per bulan!",
+                tech_stack=self.random.sample(stacks, 3),
+                features=["Sistem pembayaran multi-gateway", "Manajemen inventori real-time"],
+                created_at=now - timedelta(seconds=self.args.projects - i)
+            )
+            self.projects.append({"id": project.id, "user_id": owner["id"]})
+            batch.append(server.project_document(project))
+            if len(batch) >= 500:
+                await db.hover_items.insert_many(batch)
+                batch = []
+        if batch:
+            await db.hover_items.insert_many(batch)
+
+    async def cleanup(self):
+        if not self.args.keep:
+            await self.server.db.client.drop_database(self.server.db.name)
+
+    # Scenario request factories: each returns (method, url, kwargs)
+    def feed_request(self):
+        return "GET", "/api/projects", {"params": {"limit": 50}}
+
+    def detail_request(self):
+        project = self.random.choice(self.projects)
+        return "GET", f"/api/projects/{project['id']}", {}
+
+    def login_request(self):
+        user = self.random.choice(self.users)
+        return "POST", "/api/auth/login", {"json": {"email": user["email"], "password": PASSWORD}}
+
+    def write_request(self):
+        project = self.random.choice(self.projects)
+        token = self.tokens[project["user_id"]]
+        return "PATCH", f"/api/projects/{project['id']}", {
+            "json": {"subtitle": f"Diperbarui {self.random.randint(0, 10 ** 6)}"},
+            "headers": {"Authorization": f"Bearer {token}"},
+        }
+
+    async def run_scenario(self, client, name: str, make_request: Callable) -> dict:
+        """Issue --requests requests from --concurrency workers and summarize latencies"""
+        requests = [make_request() for _ in range(self.args.requests)]
+        latencies: List[float] = []
+        errors = 0
+        queue = iter(requests)
+
+        async def worker():
+            nonlocal errors
+            for method, url, kwargs in queue:
+                start = time.perf_counter()
+                try:
+                    response = await client.request(method, url, **kwargs)
+                    if response.status_code >= 400:
+                        errors += 1
+                except Exception:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(self.args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        return {
+            "scenario": name,
+            "requests": len(latencies),
+            "errors": errors,
+            "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        }
+
+    async def run(self, client) -> dict:
+        factories = {
+            "feed": self.feed_request,
+            "detail": self.detail_request,
+            "login": self.login_request,
+            "write": self.write_request,
+        }
+        selected = [name.strip() for name in self.args.scenarios.split(",") if name.strip()]
+        results = []
+        for name in selected:
+            if name not in factories:
+                raise SystemExit(f"Unknown scenario: {name}")
+            results.append(await self.run_scenario(client, name, factories[name]))
+            print(f"✅ {name}: {results[-1]['throughput_rps']} req/s, p95 {results[-1]['p95_ms']} ms",
+                  file=sys.stderr)
+        return {
+            "commit": git_commit(),
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "python": platform.python_version(),
+            "target": self.args.base_url or "in-process",
+            "config": {
+                "users": self.args.users,
+                "projects": self.args.projects,
+                "requests": self.args.requests,
+                "concurrency": self.args.concurrency,
+                "seed": self.args.seed,
+                "load_shedding": self.args.load_shedding,
+            },
+            "results": results,
+        }
+
+
+async def main_async(args) -> dict:
+    import httpx
+    import server
+
+    # Inject the benchmark database; the app lifespan opens the client and worker pools.
+    # Every in-process request comes from one address, so auth rate limits would turn the
+    # login scenario into a stream of 429s
+    settings = server.Settings.from_env().model_copy(update={
+        "db_name": args.db_name,
+        "seed_sample_data": False,
+        "rate_limit_enabled": False,
+        "shed_enabled": args.load_shedding,
+    })
+    app = server.create_app(settings)
+    benchmark = HoverBoardBenchmark(args, server)
+
+    async with app.router.lifespan_context(app):
+        print(f"🚀 Seeding {args.users} users and {args.projects} projects into {args.db_name}", file=sys.stderr)
+        await benchmark.seed()
+        try:
+            if args.base_url:
+                client = httpx.AsyncClient(base_url=args.base_url, timeout=30)
+            else:
+                client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark")
+            async with client:
+                return await benchmark.run(client)
+        finally:
+            # Drop the database before the lifespan closes the Mongo client
+            await benchmark.cleanup()
+
+
+def main():
+    args = parse_args()
+    report = asyncio.run(main_async(args))
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1197,7 +1197,9 @@ const ThemeToggle = ({ isDark, toggleTheme }) => (
 // Main Portfolio Page
 const PortfolioHome = ({ isDark, toggleTheme }) => {
   const [portfolioItems, setPortfolioItems] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [isProfileOpen, setIsProfileOpen] = useState(false);
   const { isAuthenticated } = useAuth();
 
@@ -1205,10 +1207,12 @@ const PortfolioHome = ({ isDark, toggleTheme }) => {
     fetchPortfolioItems();
   }, []);
 
-  const fetchPortfolioItems = async () => {
+  // The feed is paginated; the next page's cursor comes back in the X-Next-Cursor header
+  const fetchPortfolioItems = async (cursor = null) => {
     try {
-      const response = await axios.get(`${API}/projects`);
-      setPortfolioItems(response.data);
+      const response = await axios.get(`${API}/projects`, { params: cursor ? { cursor } : {} });
+      setPortfolioItems(previous => (cursor ? [...previous, ...response.data] : response.data));
+      setNextCursor(response.headers['x-next-cursor'] || null);
     } catch (error) {
       console.error('Error fetching portfolio items:', error);
     } finally {
@@ -1216,6 +1220,12 @@ const PortfolioHome = ({ isDark, toggleTheme }) => {
     }
   };
 
+  const loadMore = async () => {
+    setLoadingMore(true);
+    await fetchPortfolioItems(nextCursor);
+    setLoadingMore(false);
+  };
+
   if (loading) {
     return (
       <div className="min-h-screen bg-gradient-to-br from-blue-50 to-purple-50 dark:from-gray-900 dark:to-gray-800 
@@ -1312,6 +1322,21 @@ const PortfolioHome = ({ isDark, toggleTheme }) => {
           ))}
         </motion.div>
 
+        {nextCursor && (
+          <div className="text-center mt-12">
+            <motion.button
+              whileHover={{ scale: 1.05 }}
+              whileTap={{ scale: 0.95 }}
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="px-6 py-3 bg-blue-500 hover:bg-blue-600 disabled:opacity-60 text-white 
+                       rounded-lg font-medium transition-colors duration-200 shadow-lg"
+            >
+              {loadingMore ? 'Memuat...' : 'Muat Lebih Banyak'}
+            </motion.button>
+          </div>
+        )}
+
         {/* Footer */}
         <motion.div
           initial={{ opacity: 0 }}
@@ -1346,33 +1371,44 @@ const UserProfilePage = ({ isDark, toggleTheme }) => {
   const { user: currentUser, isAuthenticated } = useAuth();
   const [profileUser, setProfileUser] = useState(null);
   const [userProjects, setUserProjects] = useState([]);
+  const [projectTotals, setProjectTotals] = useState({ count: 0, views: 0 });
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [isProfileOpen, setIsProfileOpen] = useState(false);
 
   useEffect(() => {
-    fetchUserProfile();
-    fetchUserProjects();
+    fetchProfilePage();
   }, [username]);
 
-  const fetchUserProfile = async () => {
+  // The first page comes with the profile and totals over every project; later pages follow the cursor
+  const fetchProfilePage = async () => {
     try {
-      const response = await axios.get(`${API}/users/${username}`);
-      setProfileUser(response.data);
+      const response = await axios.get(`${API}/users/${username}/page`);
+      setProfileUser(response.data.user);
+      setUserProjects(response.data.projects);
+      setProjectTotals({ count: response.data.project_count, views: response.data.total_views });
+      setNextCursor(response.data.next_cursor);
     } catch (error) {
       console.error('Error fetching user profile:', error);
       setProfileUser(null);
+      setUserProjects([]);
+      setNextCursor(null);
+    } finally {
+      setLoading(false);
     }
   };
 
-  const fetchUserProjects = async () => {
+  const loadMore = async () => {
+    setLoadingMore(true);
     try {
-      const response = await axios.get(`${API}/users/${username}/projects`);
-      setUserProjects(response.data);
+      const response = await axios.get(`${API}/users/${username}/projects`, { params: { cursor: nextCursor } });
+      setUserProjects(previous => [...previous, ...response.data]);
+      setNextCursor(response.headers['x-next-cursor'] || null);
     } catch (error) {
       console.error('Error fetching user projects:', error);
-      setUserProjects([]);
     } finally {
-      setLoading(false);
+      setLoadingMore(false);
     }
   };
 
@@ -1475,13 +1511,13 @@ const UserProfilePage = ({ isDark, toggleTheme }) => {
           <div className="flex items-center justify-center gap-6">
             <div className="text-center">
               <p className="text-2xl font-bold text-gray-900 dark:text-white">
-                {userProjects.length}
+                {projectTotals.count}
               </p>
               <p className="text-gray-500 dark:text-gray-400">Proyek</p>
             </div>
             <div className="text-center">
               <p className="text-2xl font-bold text-gray-900 dark:text-white">
-                {userProjects.reduce((total, project) => total + project.views, 0)}
+                {projectTotals.views}
               </p>
               <p className="text-gray-500 dark:text-gray-400">Dilihat</p>
             </div>
@@ -1530,6 +1566,21 @@ const UserProfilePage = ({ isDark, toggleTheme }) => {
                 <PortfolioCard key={project.id} item={project} index={index} />
               ))}
             </motion.div>
+
+            {nextCursor && (
+              <div className="text-center mt-12">
+                <motion.button
+                  whileHover={{ scale: 1.05 }}
+                  whileTap={{ scale: 0.95 }}
+                  onClick={loadMore}
+                  disabled={loadingMore}
+                  className="px-6 py-3 bg-blue-500 hover:bg-blue-600 disabled:opacity-60 text-white 
+                           rounded-lg font-medium transition-colors duration-200 shadow-lg"
+                >
+                  {loadingMore ? 'Memuat...' : 'Muat Lebih Banyak'}
+                </motion.button>
+              </div>
+            )}
           </>
         ) : (
           <motion.div
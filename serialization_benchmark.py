@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Serialization microbenchmark for HoverBoard read endpoints.
+Compares the old validate + jsonable_encoder + JSONResponse path with the
+trusted-read orjson path, reported as milliseconds per 1000 projects.
+
+Usage: python serialization_benchmark.py [--projects 1000] [--repeat 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "backend"))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "hoverboard_benchmark")
+
+from bson import ObjectId  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+import server  # noqa: E402
+
+
+def make_documents(count: int) -> list:
+    """Documents shaped like hover_items as read back from Mongo"""
+    documents = []
+    for i in range(count):
+        documents.append({
+            "_id": ObjectId(),
+            "id": str(uuid.uuid4()),
+            "user_id": str(uuid.uuid4()),
+            "title": f"Project {i}",
+            "subtitle": "React & Node.js",
+            "description": "Portfolio modern dengan animasi interaktif yang menawan",
+            "detailed_description": "Sebuah website portfolio yang dirancang khusus untuk menampilkan karya-karya terbaik " * 4,
+            "category": "web",
+            "image_url": "https://images.unsplash.com/photo-1467232004584-a241de8bcf5d?w=400&h=300&fit=crop",
+            "gallery_images": [
+                "https://images.unsplash.com/photo-1498050108023-c5249f4df085?w=600&h=400&fit=crop",
+                "https://images.unsplash.com/photo-1461749280684-dccba630e2f6?w=600&h=400&fit=crop",
+            ],
+            "hover_content": "Dibuat dengan React, Node.js, dan MongoDB.",
+            "fun_fact": "Proyek ini selesai dalam 3 hari!",
+            "tech_stack": ["React", "Node.js", "MongoDB", "Tailwind CSS"],
+            "features": ["Mode gelap dan terang", "Animasi interaktif", "Desain responsif"],
+            "challenges": ["Optimasi performa animasi"],
+            "solutions": ["Implementasi lazy loading"],
+            "link_url": None,
+            "github_url": "https://github.com/demo/portfolio",
+            "demo_url": "https://portfolio-demo.com",
+            "created_at": datetime.utcnow(),
+            "duration": "3 hari",
+            "team_size": 1,
+            "status": "selesai",
+            "views": i,
+        })
+    return documents
+
+
+def validated_path(documents: list, model) -> bytes:
+    items = [model(**document) for document in documents]
+    return JSONResponse(jsonable_encoder(items)).body
+
+
+def trusted_path(documents: list, read) -> bytes:
+    return server.trusted_json([read(document) for document in documents]).body
+
+
+def measure(func, documents, arg, repeat: int, per: int) -> float:
+    seconds = min(timeit.repeat(lambda: func(documents, arg), number=1, repeat=repeat))
+    return round(seconds * 1000 * per / len(documents), 3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--projects", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    documents = make_documents(args.projects)
+    results = {"projects": args.projects, "unit": "ms per 1000 projects"}
+    for view, model, read in (
+        ("full", server.HoverItem, server.read_hover_item),
+        ("summary", server.HoverItemSummary, server.read_hover_item_summary),
+    ):
+        before = measure(validated_path, documents, model, args.repeat, 1000)
+        after = measure(trusted_path, documents, read, args.repeat, 1000)
+        results[view] = {"before": before, "after": after, "speedup": round(before / after, 1)}
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
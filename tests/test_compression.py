@@ -0,0 +1,130 @@
+"""
+Encoding negotiation, ETag suffixes and the compressed body cache (no MongoDB needed).
+"""
+
+import asyncio
+import gzip
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+import compression  # noqa: E402
+from compression import CompressionMiddleware  # noqa: E402
+
+
+def http_scope(accept_encoding=None, if_none_match=None):
+    headers = []
+    if accept_encoding is not None:
+        headers.append((b"accept-encoding", accept_encoding.encode("latin-1")))
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode("latin-1")))
+    return {"type": "http", "method": "GET", "path": "/api/items", "headers": headers}
+
+
+def versioned_app(body_for):
+    """An app that tags responses "v1" and answers a matching If-None-Match with 304"""
+    async def app(scope, receive, send):
+        if_none_match = dict(scope["headers"]).get(b"if-none-match")
+        if if_none_match == b'"v1"':
+            await send({"type": "http.response.start", "status": 304, "headers": [(b"etag", b'"v1"')]})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        body = body_for()
+        await send({"type": "http.response.start", "status": 200, "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"etag", b'"v1"'),
+        ]})
+        await send({"type": "http.response.body", "body": body})
+    return app
+
+
+def call(middleware, scope):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(middleware(scope, receive, send))
+    start = messages[0]
+    headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in start["headers"]}
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return start["status"], headers, body
+
+
+def test_negotiate_prefers_brotli_and_honours_q_zero(monkeypatch):
+    middleware = CompressionMiddleware(None)
+    monkeypatch.setattr(compression, "brotli", None)
+    assert middleware.negotiate(http_scope("gzip, deflate, br")) == "gzip"
+    assert middleware.negotiate(http_scope("gzip;q=0, deflate")) is None
+    assert middleware.negotiate(http_scope("*")) == "gzip"
+    assert middleware.negotiate(http_scope("*, gzip;q=0")) is None
+    assert middleware.negotiate(http_scope()) is None
+
+    monkeypatch.setattr(compression, "brotli", object())
+    assert middleware.negotiate(http_scope("gzip, br")) == "br"
+    assert middleware.negotiate(http_scope("gzip, br;q=0")) == "gzip"
+
+
+def test_compressed_etag_round_trips_through_if_none_match(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    body = b'{"items": "' + b"x" * 4096 + b'"}'
+    middleware = CompressionMiddleware(versioned_app(lambda: body), minimum_size=1024)
+
+    status, headers, compressed = call(middleware, http_scope("gzip"))
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert headers["etag"] == '"v1-gzip"'
+    assert "Accept-Encoding" in headers["vary"]
+    assert gzip.decompress(compressed) == body
+
+    status, headers, _ = call(middleware, http_scope("gzip", if_none_match='"v1-gzip"'))
+    assert status == 304
+    assert headers["etag"] == '"v1-gzip"'
+
+    # A client without gzip holding the compressed tag gets the identity body back
+    status, headers, plain = call(middleware, http_scope(if_none_match='"v1-gzip"'))
+    assert status == 200
+    assert headers["etag"] == '"v1"'
+    assert plain == body
+
+
+def test_small_bodies_pass_through_uncompressed(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    middleware = CompressionMiddleware(versioned_app(lambda: b'{"ok": true}'), minimum_size=1024)
+    status, headers, body = call(middleware, http_scope("gzip"))
+    assert status == 200
+    assert "content-encoding" not in headers
+    assert headers["etag"] == '"v1"'
+    assert body == b'{"ok": true}'
+
+
+def test_body_cache_follows_content_not_etag(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    bodies = []
+
+    def body_for():
+        return bodies[-1]
+
+    def padded(views):
+        return b'{"views": ' + str(views).encode() + b', "pad": "' + b"x" * 2048 + b'"}'
+
+    middleware = CompressionMiddleware(versioned_app(body_for), minimum_size=1024)
+
+    # Same ETag, changed view count: the new bytes are compressed, not the cached ones served
+    bodies.append(padded(1))
+    first = gzip.decompress(call(middleware, http_scope("gzip"))[2])
+    bodies.append(padded(2))
+    second = gzip.decompress(call(middleware, http_scope("gzip"))[2])
+    assert (first, second) == (padded(1), padded(2))
+    assert middleware.cache.stats()["size"] == 2
+
+    # A repeated body is served from the cache
+    call(middleware, http_scope("gzip"))
+    stats = middleware.cache.stats()
+    assert stats["size"] == 2
+    assert stats["hits"] == 1
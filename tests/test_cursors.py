@@ -0,0 +1,51 @@
+"""
+Keyset cursor encoding and decoding (no MongoDB needed).
+"""
+
+import base64
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+# server reads its settings at import time; no connection is opened until startup
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "blog_ryuza_test")
+
+from server import decode_cursor, encode_cursor  # noqa: E402
+
+
+def raw_cursor(value) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 123000, tzinfo=timezone.utc)
+    cursor = encode_cursor(created_at, "project-1")
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, "project-1")
+
+
+@pytest.mark.parametrize("cursor", [
+    "!!!",
+    "a",
+    base64.urlsafe_b64encode(b"not json").decode("ascii"),
+    base64.urlsafe_b64encode(b"\xff\xfe").decode("ascii"),
+    raw_cursor(42),
+    raw_cursor(["2024-05-01T12:30:15"]),
+    raw_cursor(["2024-05-01T12:30:15", "id", "extra"]),
+    raw_cursor(["yesterday", "id"]),
+    raw_cursor([123, "id"]),
+    raw_cursor({"created_at": "2024-05-01", "id": "x"}),
+])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor)
+    assert error.value.status_code == 400
+
@@ -0,0 +1,139 @@
+"""
+Query plan checks for the declared MongoDB indexes.
+Requires a local mongod (MONGO_URL, default mongodb://localhost:27017); skipped otherwise.
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+from pymongo.errors import DuplicateKeyError, ServerSelectionTimeoutError  # noqa: E402
+
+from indexes import ensure_indexes, index_drift  # noqa: E402
+from search import prefix_query  # noqa: E402
+
+MONGO_URL = os.environ.get("MONGO_URL", "mongodb://localhost:27017")
+
+
+def plan_stages(plan: dict) -> set:
+    """Collect every stage name in a winning plan tree"""
+    stages = {plan.get("stage")}
+    for child_key in ("inputStage", "queryPlan"):
+        if child_key in plan:
+            stages |= plan_stages(plan[child_key])
+    for child in plan.get("inputStages", []):
+        stages |= plan_stages(child)
+    return stages
+
+
+def winning_plan(explain: dict) -> dict:
+    return explain["queryPlanner"]["winningPlan"]
+
+
+def run_with_db(check):
+    async def runner():
+        client = AsyncIOMotorClient(MONGO_URL, serverSelectionTimeoutMS=500)
+        try:
+            await client.admin.command("ping")
+        except ServerSelectionTimeoutError:
+            client.close()
+            pytest.skip("MongoDB is not available")
+
+        db = client[f"hoverboard_test_{uuid.uuid4().hex[:8]}"]
+        try:
+            await ensure_indexes(db)
+            await seed(db)
+            await check(db)
+        finally:
+            await client.drop_database(db.name)
+            client.close()
+
+    asyncio.run(runner())
+
+
+async def seed(db):
+    now = datetime.utcnow()
+    await db.users.insert_many([
+        {"id": f"user-{i}", "email": f"user{i}@example.com", "username": f"user_{i}" if i % 2 else ""}
+        for i in range(20)
+    ])
+    await db.hover_items.insert_many([
+        {"id": f"item-{i}", "user_id": f"user-{i % 20}", "created_at": now + timedelta(seconds=i)}
+        for i in range(200)
+    ])
+
+
+def keyset_page(query: dict, now: datetime) -> dict:
+    """``query`` narrowed to the page after (now, "item-1"), as paginate_projects builds it"""
+    return {
+        "$and": [
+            query,
+            {"$or": [
+                {"created_at": {"$gt": now}},
+                {"created_at": now, "id": {"$gt": "item-1"}},
+            ]},
+        ]
+    }
+
+
+def test_hot_queries_use_index_scans():
+    async def check(db):
+        now = datetime.utcnow()
+        page_order = [("created_at", 1), ("id", 1)]
+        # Keyset pages must come back in index order, without an in-memory SORT
+        paginated = [
+            db.hover_items.find({"user_id": "user-3"}).sort(page_order).limit(51),
+            db.hover_items.find(keyset_page({"user_id": "user-3"}, now)).sort(page_order).limit(51),
+            db.hover_items.find(keyset_page({}, now)).sort(page_order).limit(51),
+            db.hover_items.find({"category": "web", "tech_stack": {"$all": ["React"]}}).sort(
+                page_order
+            ).limit(51),
+            db.hover_items.find(keyset_page({"status": "aktif"}, now)).sort(page_order).limit(51),
+            db.project_view_buckets.find({"project_id": "item-3", "hour": {"$gte": now}}).sort("hour", 1),
+        ]
+        others = [
+            db.users.find({"id": "user-3"}),
+            db.users.find({"email": "user3@example.com"}),
+            db.users.find({"username": "user_3"}),
+            db.hover_items.find({"id": "item-42"}),
+            db.hover_items.find({"$text": {"$search": "item"}}),
+            db.hover_items.find(prefix_query("react ite")).limit(20),
+            db.project_view_buckets.find({"hour": {"$gte": now - timedelta(hours=168)}}),
+        ]
+        for cursor in paginated + others:
+            stages = plan_stages(winning_plan(await cursor.explain()))
+            assert "IXSCAN" in stages
+            assert "COLLSCAN" not in stages
+        for cursor in paginated:
+            assert "SORT" not in plan_stages(winning_plan(await cursor.explain()))
+
+    run_with_db(check)
+
+
+def test_unique_indexes_reject_duplicates():
+    async def check(db):
+        with pytest.raises(DuplicateKeyError):
+            await db.users.insert_one({"id": "dup", "email": "user1@example.com", "username": ""})
+        with pytest.raises(DuplicateKeyError):
+            await db.users.update_one({"id": "user-2"}, {"$set": {"username": "user_1"}})
+        # Several users may still be waiting to choose a username
+        await db.users.insert_one({"id": "fresh", "email": "fresh@example.com", "username": ""})
+
+    run_with_db(check)
+
+
+def test_no_drift_after_bootstrap():
+    async def check(db):
+        drift = await index_drift(db)
+        for collection_drift in drift.values():
+            assert collection_drift == {"missing": [], "changed": [], "extra": []}
+
+    run_with_db(check)
@@ -0,0 +1,78 @@
+"""
+Token-bucket refill, eviction and backend contract (no MongoDB needed).
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from ratelimit import MemoryRateLimitBackend, RateLimit, RateLimitBackend, RateLimiter  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_allows_burst_then_refills_at_rate():
+    async def check():
+        clock = FakeClock()
+        limiter = RateLimiter(MemoryRateLimitBackend(clock=clock))
+        limit = RateLimit(per_minute=60, burst=3)
+        assert [await limiter.check("ip:a", limit) for _ in range(3)] == [0, 0, 0]
+        assert await limiter.check("ip:a", limit) == pytest.approx(1.0)
+        # Other keys have their own bucket
+        assert await limiter.check("ip:b", limit) == 0
+
+        clock.now += 1
+        assert await limiter.check("ip:a", limit) == 0
+        assert await limiter.check("ip:a", limit) > 0
+
+        # Refill is capped at the burst size
+        clock.now += 3600
+        assert [await limiter.check("ip:a", limit) for _ in range(4)][-1] > 0
+
+    asyncio.run(check())
+
+
+def test_sweep_evicts_only_fully_refilled_buckets():
+    async def check():
+        clock = FakeClock()
+        backend = MemoryRateLimitBackend(sweep_every=3, clock=clock)
+        await backend.take("idle", 1, 2)
+        clock.now += 10
+        await backend.take("busy", 1, 2)
+        # The third call triggers a sweep: "idle" has refilled, "busy" has not
+        await backend.take("busy", 1, 2)
+        assert len(backend) == 1
+        assert await backend.take("busy", 1, 2) > 0
+
+    asyncio.run(check())
+
+
+def test_oldest_bucket_dropped_beyond_max_keys():
+    async def check():
+        backend = MemoryRateLimitBackend(max_keys=2, clock=FakeClock())
+        for key in ("a", "b", "c"):
+            await backend.take(key, 1, 1)
+        assert len(backend) == 2
+        # "a" was evicted, so it starts again from a full bucket
+        assert await backend.take("a", 1, 1) == 0
+        assert await backend.take("c", 1, 1) > 0
+
+    asyncio.run(check())
+
+
+def test_backend_without_take_cannot_be_created():
+    class Incomplete(RateLimitBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,127 @@
+"""
+Concurrency limiter and load shedding middleware behaviour (no MongoDB needed).
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from shedding import ConcurrencyLimiter, LoadSheddingMiddleware  # noqa: E402
+
+
+def test_release_hands_slot_to_oldest_waiter():
+    async def check():
+        limiter = ConcurrencyLimiter(1, queue_timeout=1)
+        assert await limiter.acquire()
+        order = []
+
+        async def waiter(name):
+            assert await limiter.acquire()
+            order.append(name)
+
+        first = asyncio.create_task(waiter("first"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(waiter("second"))
+        await asyncio.sleep(0)
+        assert limiter.stats()["queued"] == 2
+
+        limiter.release()
+        await first
+        # The slot passed straight to the waiter, so the count never dropped
+        assert limiter.in_flight == 1
+        assert order == ["first"]
+
+        limiter.release()
+        await second
+        assert order == ["first", "second"]
+        limiter.release()
+        assert limiter.in_flight == 0
+
+    asyncio.run(check())
+
+
+def test_queue_deadline_rejects_and_leaves_no_waiter():
+    async def check():
+        limiter = ConcurrencyLimiter(1, queue_timeout=0.01)
+        assert await limiter.acquire()
+        assert not await limiter.acquire()
+        stats = limiter.stats()
+        assert stats["rejected"] == 1
+        assert stats["queued"] == 0
+        limiter.release()
+        assert limiter.in_flight == 0
+
+    asyncio.run(check())
+
+
+def test_full_queue_rejects_immediately():
+    async def check():
+        limiter = ConcurrencyLimiter(1, queue_timeout=1, max_queue=0)
+        assert await limiter.acquire()
+        assert not await limiter.acquire()
+        assert limiter.rejected == 1
+
+    asyncio.run(check())
+
+
+def test_cancelled_waiter_does_not_leak_a_slot():
+    async def check():
+        limiter = ConcurrencyLimiter(1, queue_timeout=1)
+        assert await limiter.acquire()
+        task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        assert limiter.stats()["queued"] == 0
+
+        limiter.release()
+        assert limiter.in_flight == 0
+        assert await limiter.acquire()
+
+    asyncio.run(check())
+
+
+def test_adaptive_limit_shrinks_over_target_and_recovers():
+    limiter = ConcurrencyLimiter(10, queue_timeout=1, target_p95=0.1, window=10)
+    limiter.in_flight = 20
+    for _ in range(10):
+        limiter.release(0.5)
+    assert limiter.limit == 9
+    for _ in range(10):
+        limiter.release(0.01)
+    assert limiter.limit == 10
+
+
+async def slow_app(scope, receive, send):
+    await asyncio.sleep(0.05)
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def test_middleware_sheds_with_retry_after_and_skips_unlimited_paths():
+    async def check():
+        limiters = {"auth": ConcurrencyLimiter(1, queue_timeout=0)}
+        app = LoadSheddingMiddleware(
+            slow_app, limiters, route_groups=[("auth", "POST", "/api/auth/")], unlimited=["/api/"]
+        )
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(
+                client.post("/api/auth/login"), client.post("/api/auth/login"),
+                client.get("/api/"), client.get("/api/")
+            )
+        statuses = sorted(response.status_code for response in responses[:2])
+        assert statuses == [200, 503]
+        shed = next(response for response in responses[:2] if response.status_code == 503)
+        assert shed.headers["retry-after"] == "1"
+        assert [response.status_code for response in responses[2:]] == [200, 200]
+        assert app.group_for("GET", "/api/projects") == "default"
+
+    asyncio.run(check())
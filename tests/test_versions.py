@@ -0,0 +1,32 @@
+"""
+If-None-Match matching for the versioned public reads (no MongoDB needed).
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from versions import etag_matches, make_etag  # noqa: E402
+
+
+def test_etag_matches_lists_and_weak_tags():
+    assert etag_matches('"a", "b"', '"b"')
+    assert etag_matches('W/"b"', '"b"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
+    assert not etag_matches("", '"b"')
+
+
+def test_etag_wildcard_does_not_match():
+    assert not etag_matches("*", '"b"')
+
+
+def test_weak_tags_match_either_form():
+    weak = make_etag((3, 7), "/api/projects", "", weak=True)
+    strong = make_etag((3, 7), "/api/projects", "")
+    assert weak == "W/" + strong
+    assert etag_matches(weak, weak)
+    assert etag_matches(strong, weak)
+    assert etag_matches(weak, strong)
+    assert not etag_matches(make_etag((3, 8), "/api/projects", "", weak=True), weak)
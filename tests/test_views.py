@@ -0,0 +1,140 @@
+"""
+Write-behind view counter flushing, requeueing and early wake-ups (no MongoDB needed).
+"""
+
+import asyncio
+import sys
+from collections import Counter
+from pathlib import Path
+
+from pymongo import UpdateOne
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from analytics import bucket_updates  # noqa: E402
+from views import VIEWS_SCOPE, ViewCounter  # noqa: E402
+
+
+class FakeCollection:
+    """Records bulk_write batches; fails while ``fail`` is set and waits while ``gate`` is clear"""
+
+    def __init__(self):
+        self.batches = []
+        self.fail = False
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def bulk_write(self, operations, ordered=True):
+        await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("write failed")
+        self.batches.append(operations)
+
+
+class FakeVersionStore:
+    def __init__(self):
+        self.bumps = []
+
+    async def bump(self, *scopes):
+        self.bumps.append(scopes)
+
+
+def views_inc(project_id, count):
+    return UpdateOne({"id": project_id}, {"$inc": {"views": count}})
+
+
+def test_flush_writes_one_batch_per_project():
+    async def check():
+        collection = FakeCollection()
+        counter = ViewCounter(collection)
+        assert [counter.record("a"), counter.record("a"), counter.record("b")] == [1, 2, 1]
+        await counter.flush()
+        assert collection.batches == [[views_inc("a", 2), views_inc("b", 1)]]
+        assert counter.unflushed("a") == 0
+        # Nothing pending, so nothing is written
+        await counter.flush()
+        assert len(collection.batches) == 1
+
+    asyncio.run(check())
+
+
+def test_failed_flush_requeues_totals_and_buckets():
+    async def check():
+        collection, buckets = FakeCollection(), FakeCollection()
+        counter = ViewCounter(collection, bucket_collection=buckets)
+        counter.record("a")
+        counter.record("a")
+        counter.record_bucket("b")
+        collection.fail = True
+        await counter.flush()
+        assert collection.batches == [] and buckets.batches == []
+        assert counter.unflushed("a") == 2
+
+        counter.record("a")
+        collection.fail = False
+        await counter.flush()
+        assert collection.batches == [[views_inc("a", 3)]]
+        assert buckets.batches == [bucket_updates(Counter({"a": 3, "b": 1}))]
+
+    asyncio.run(check())
+
+
+def test_unflushed_includes_views_being_written():
+    async def check():
+        collection = FakeCollection()
+        collection.gate.clear()
+        counter = ViewCounter(collection)
+        counter.record("a")
+        counter.record("a")
+        flush = asyncio.create_task(counter.flush())
+        await asyncio.sleep(0)
+        # Two views are in the write, one more arrives meanwhile
+        assert counter.record("a") == 3
+        assert counter.unflushed("a") == 3
+
+        collection.gate.set()
+        await flush
+        assert counter.unflushed("a") == 1
+
+    asyncio.run(check())
+
+
+def test_max_events_wakes_the_flush_loop_early():
+    async def check():
+        collection = FakeCollection()
+        counter = ViewCounter(collection, flush_interval_ms=60000, flush_max_events=3)
+        counter.start()
+        counter.record("a")
+        counter.record("b")
+        await asyncio.sleep(0.01)
+        assert collection.batches == []
+
+        counter.record("a")
+        await asyncio.sleep(0.01)
+        assert collection.batches == [[views_inc("a", 2), views_inc("b", 1)]]
+
+        counter.record("c")
+        await counter.stop()
+        assert collection.batches[-1] == [views_inc("c", 1)]
+
+    asyncio.run(check())
+
+
+def test_saved_views_bump_the_views_version():
+    async def check():
+        collection, versions = FakeCollection(), FakeVersionStore()
+        counter = ViewCounter(collection, version_store=versions)
+        counter.record("a")
+        collection.fail = True
+        await counter.flush()
+        assert versions.bumps == []
+
+        collection.fail = False
+        await counter.flush()
+        # Strict mode already saved its views; its bucket events bump the version too
+        counter.record_bucket("b")
+        await counter.flush()
+        await counter.flush()
+        assert versions.bumps == [(VIEWS_SCOPE,), (VIEWS_SCOPE,)]
+
+    asyncio.run(check())